@@ -0,0 +1,41 @@
+from collections import OrderedDict
+
+class AppPool:
+    def __init__(self, budget_bytes=32 * 1024 * 1024):
+        self.budget_bytes = budget_bytes
+        self.apps = OrderedDict()
+
+    def memory_usage(self):
+        return sum(app.memory_usage() for app in self.apps.values())
+
+    def suspend(self, app_name, app):
+        app.on_suspend()
+
+        self.apps[app_name] = app
+        self.apps.move_to_end(app_name)
+
+        self.trim()
+
+    def resume(self, app_name):
+        app = self.apps.pop(app_name, None)
+
+        if app is not None:
+            app.on_resume()
+
+        return app
+
+    def trim(self):
+        while len(self.apps) > 1 and self.memory_usage() > self.budget_bytes:
+            self.apps.popitem(last=False)[1].close()
+
+    def discard(self, app_name):
+        app = self.apps.pop(app_name, None)
+
+        if app is not None:
+            app.close()
+
+    def clear(self):
+        for app in self.apps.values():
+            app.close()
+
+        self.apps.clear()
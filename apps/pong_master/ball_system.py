@@ -0,0 +1,93 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class BallSystem:
+    def __init__(self, screen_size, sprites, trail_length=8, trail_interval=0.015):
+        self.screen_size = screen_size
+        self.size = screen_size[1] // 40
+        self.radius = self.size // 2
+        self.sprites = sprites
+
+        self.pos = np.empty((0, 2))
+        self.prev_pos = np.empty((0, 2))
+        self.velocity = np.empty((0, 2))
+        self.color_index = np.empty(0, dtype=np.intp)
+        self.palette = []
+
+        self.trail_length = trail_length
+        self.trail_interval = trail_interval
+        self.last_trail_time = 0.0
+        self.trail = np.empty((0, trail_length, 2), dtype=np.int32)
+        self.trail_head = 0
+        self.trail_count = 0
+
+    def __len__(self):
+        return len(self.pos)
+
+    def spawn(self, angles, speeds, color):
+        angles = np.asarray(angles, dtype=float)
+        speeds = np.asarray(speeds, dtype=float)
+
+        if color not in self.palette:
+            self.palette.append(color)
+
+        pos = np.empty((len(angles), 2))
+        pos[:] = (self.screen_size[0] // 2, self.screen_size[1] // 2)
+
+        velocity = np.column_stack((speeds * np.sin(angles), speeds * np.cos(angles)))
+
+        self.pos = np.concatenate((self.pos, pos))
+        self.prev_pos = np.concatenate((self.prev_pos, pos))
+        self.velocity = np.concatenate((self.velocity, velocity))
+        self.color_index = np.concatenate((self.color_index,
+                                           np.full(len(angles), self.palette.index(color), dtype=np.intp)))
+
+        self.trail = np.zeros((len(self.pos), self.trail_length, 2), dtype=np.int32)
+        self.trail_count = 0
+
+    def update(self, delta):
+        pos = self.pos
+        velocity = self.velocity
+
+        self.prev_pos[:] = pos
+        pos += velocity * delta
+
+        for axis, limit in enumerate((self.screen_size[0] - self.size, self.screen_size[1] - self.size)):
+            low = pos[:, axis] < 0
+            pos[low, axis] = 0
+            velocity[low, axis] = np.abs(velocity[low, axis])
+
+            high = pos[:, axis] > limit
+            pos[high, axis] = limit
+            velocity[high, axis] = -np.abs(velocity[high, axis])
+
+        self.last_trail_time += delta
+        while self.last_trail_time >= self.trail_interval:
+            self.trail[:, self.trail_head] = pos.astype(np.int32) + self.radius
+            self.trail_head = (self.trail_head + 1) % self.trail_length
+            self.trail_count = min(self.trail_count + 1, self.trail_length)
+
+            self.last_trail_time -= self.trail_interval
+
+    def draw(self, screen, interpolation=1.0):
+        colors = self.color_index.tolist()
+        blits = []
+
+        for i in range(self.trail_count):
+            t = (i + 1) / self.trail_count
+            alpha = int(255 * (1 - t))
+            radius = int(self.radius * (1 - t) + 1 * t)
+
+            sprites = [self.sprites.get(color, radius, alpha) for color in self.palette]
+            points = (self.trail[:, (self.trail_head - 1 - i) % self.trail_length] - radius).tolist()
+
+            blits.extend(zip([sprites[color] for color in colors], points))
+
+        sprites = [self.sprites.get(color, self.radius, 255) for color in self.palette]
+        points = (self.prev_pos + (self.pos - self.prev_pos) * interpolation).astype(np.int32).tolist()
+
+        blits.extend(zip([sprites[color] for color in colors], points))
+
+        screen.blits(blits, doreturn=False)
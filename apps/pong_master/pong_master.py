@@ -0,0 +1,691 @@
+import pygame
+import colorsys
+import math
+import random
+
+from collections import OrderedDict
+
+from base_app import BaseApp
+from spatial import SpatialGrid
+from widgets import Label, Button, Panel
+import fonts
+
+from .ball_system import BallSystem, np
+
+PAUSE_ALPHA = 150
+
+class TrailSprites:
+    def __init__(self, alpha_step=1, max_sprites=512):
+        self.alpha_step = alpha_step
+        self.max_sprites = max_sprites
+        self.sprites = OrderedDict()
+
+    def get(self, color, radius, alpha):
+        alpha -= alpha % self.alpha_step
+        key = (tuple(color), radius, alpha)
+
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.sprites.move_to_end(key)
+            return sprite
+
+        sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (*color, alpha), (radius, radius), radius)
+
+        self.sprites[key] = sprite
+        if len(self.sprites) > self.max_sprites:
+            self.sprites.popitem(last=False)
+
+        return sprite
+
+trail_sprites = TrailSprites()
+
+class Ball:
+    def __init__(self, screen_size, angle=math.radians(135), speed=300.0, color=(0, 0, 0), sprites=trail_sprites):
+        self.rect = pygame.Rect(screen_size[0] // 2, screen_size[1] // 2,
+                                 screen_size[1] // 40, screen_size[1] // 40)
+
+        self.ball_angle = angle
+        self.ball_speed = speed
+        self.color = color
+        self.ball_pos: list[float] = [self.rect.left, self.rect.top]
+        self.prev_pos: list[float] = list(self.ball_pos)
+
+        self.last_trail_time = 0.0
+        self.trail_length = 8
+        self.trail_interval = 0.015
+        self.trail = []
+        self.sprites = sprites
+
+    @staticmethod
+    def biased_random(start, end, alpha=0.3):
+        r = random.betavariate(alpha, alpha)
+        return start + (end - start) * r
+
+    def velocity(self):
+        return self.ball_speed * math.sin(self.ball_angle), self.ball_speed * math.cos(self.ball_angle)
+
+    def sweep(self, velocity, rect):
+        t_entry, t_exit = -math.inf, math.inf
+        normal = (0, 0)
+
+        bounds = ((rect.left - self.rect.width, rect.right), (rect.top - self.rect.height, rect.bottom))
+        for axis, (low, high) in enumerate(bounds):
+            if velocity[axis] == 0:
+                if not low < self.ball_pos[axis] < high:
+                    return None
+                continue
+
+            t_low = (low - self.ball_pos[axis]) / velocity[axis]
+            t_high = (high - self.ball_pos[axis]) / velocity[axis]
+            near, far = min(t_low, t_high), max(t_low, t_high)
+
+            if near > t_entry:
+                t_entry = near
+                normal = (-1, 0) if axis == 0 else (0, -1)
+                if velocity[axis] < 0:
+                    normal = (-normal[0], -normal[1])
+
+            t_exit = min(t_exit, far)
+
+        if t_entry > t_exit or t_exit <= 0:
+            return None
+
+        if velocity[0] * normal[0] + velocity[1] * normal[1] >= 0:
+            return None
+
+        return max(t_entry, 0.0), normal
+
+    def update(self, delta, screen_size, on_death=None, game=None, obstacles=()):
+        self.prev_pos[:] = self.ball_pos
+
+        obstacles = list(obstacles)
+        remaining = delta
+
+        for _ in range(8):
+            velocity = self.velocity()
+
+            hit_time, hit = remaining, None
+
+            if velocity[0] < 0 and (0 - self.ball_pos[0]) / velocity[0] < hit_time:
+                hit_time, hit = (0 - self.ball_pos[0]) / velocity[0], 'left'
+
+            if velocity[0] > 0 and (screen_size[0] - self.rect.width - self.ball_pos[0]) / velocity[0] < hit_time:
+                hit_time, hit = (screen_size[0] - self.rect.width - self.ball_pos[0]) / velocity[0], 'right'
+
+            if velocity[1] < 0 and (0 - self.ball_pos[1]) / velocity[1] < hit_time:
+                hit_time, hit = (0 - self.ball_pos[1]) / velocity[1], 'top'
+
+            if velocity[1] > 0 and (screen_size[1] - self.rect.height - self.ball_pos[1]) / velocity[1] < hit_time:
+                hit_time, hit = (screen_size[1] - self.rect.height - self.ball_pos[1]) / velocity[1], 'bottom'
+
+            for obstacle in obstacles:
+                collision = self.sweep(velocity, obstacle[0])
+                if collision is not None and collision[0] < hit_time:
+                    hit_time, hit = collision[0], obstacle
+                    normal = collision[1]
+
+            hit_time = max(hit_time, 0.0)
+            self.ball_pos[0] += velocity[0] * hit_time
+            self.ball_pos[1] += velocity[1] * hit_time
+            self.rect.topleft = (int(self.ball_pos[0]), int(self.ball_pos[1]))
+
+            remaining -= hit_time
+
+            if hit is None:
+                break
+
+            if hit in ('left', 'right'):
+                self.ball_angle = -self.ball_angle
+
+            elif hit == 'top':
+                self.ball_angle = math.pi - self.ball_angle
+
+            elif hit == 'bottom':
+                if on_death is not None:
+                    on_death(game)
+                    break
+
+                self.ball_angle = math.pi - self.ball_angle
+
+            else:
+                hit[1](self)
+
+                velocity = self.velocity()
+                if velocity[0] * normal[0] + velocity[1] * normal[1] < 0:
+                    obstacles.remove(hit)
+
+        self.rect.topleft = (int(self.ball_pos[0]), int(self.ball_pos[1]))
+
+    def on_collide(self, player):
+        hit_pos = 2 * (self.rect.centerx - player.centerx) / player.width
+        angle = math.pi - hit_pos * math.pi / 4
+
+        if abs(hit_pos) < 0.2:
+            angle += self.biased_random(-math.radians(10), math.radians(10))
+
+        self.ball_angle = angle
+
+    def render_center(self, interpolation=1.0):
+        x = self.prev_pos[0] + (self.ball_pos[0] - self.prev_pos[0]) * interpolation
+        y = self.prev_pos[1] + (self.ball_pos[1] - self.prev_pos[1]) * interpolation
+
+        return int(x) + self.rect.width // 2, int(y) + self.rect.height // 2
+
+    def draw(self, screen, interpolation=1.0):
+        pygame.draw.circle(screen, self.color, self.render_center(interpolation), self.rect.width // 2)
+
+    def dirty_rect(self, interpolation=1.0):
+        rect = self.rect.copy()
+        rect.center = self.render_center(interpolation)
+
+        radius = self.rect.width // 2
+        return rect.unionall([pygame.Rect(x - radius, y - radius, radius * 2, radius * 2)
+                              for x, y in self.trail]).inflate(2, 2)
+
+    def update_trail(self, delta):
+        self.last_trail_time += delta
+        while self.last_trail_time >= self.trail_interval:
+            if len(self.trail) == self.trail_length:
+                self.trail.pop(0)
+            self.trail.append(self.rect.center)
+            self.last_trail_time -= self.trail_interval
+
+    def draw_trail(self, screen):
+        for i, pos in enumerate(self.trail[::-1]):
+            t = (i + 1) / len(self.trail)
+            alpha = int(255 * (1 - t))
+            radius = int(self.rect.width // 2 * (1 - t) + 1 * t)
+
+            screen.blit(self.sprites.get(self.color, radius, alpha), (pos[0] - radius, pos[1] - radius))
+
+class BallList:
+    def __init__(self, screen_size, sprites=trail_sprites):
+        self.screen_size = screen_size
+        self.sprites = sprites
+        self.balls = []
+
+    def __len__(self):
+        return len(self.balls)
+
+    def spawn(self, angles, speeds, color):
+        for angle, speed in zip(angles, speeds):
+            self.balls.append(Ball(self.screen_size, angle, speed, color, self.sprites))
+
+    def update(self, delta):
+        for ball in self.balls:
+            ball.update(delta, self.screen_size)
+            ball.update_trail(delta)
+
+    def draw(self, screen, interpolation=1.0):
+        for ball in self.balls:
+            ball.draw_trail(screen)
+            ball.draw(screen, interpolation)
+
+class PowerUp:
+    def __init__(self, pos, power=None) -> None:
+        self.pos = pos
+        self.power = power
+        self.rect = pygame.Rect(pos, (15, 15))
+
+    @staticmethod
+    def render_power_up():
+        surf = pygame.Surface((15, 15))
+        surf.fill((0, 0, 0))
+        pygame.draw.ellipse(surf, (255, 255, 255), (0, 0, 15, 15))
+        surf.set_colorkey((0, 0, 0))
+
+        return surf
+
+    def apply_power(self, *args, **kwargs):
+        if self.power is not None:
+            self.power(*args, **kwargs)
+
+class PongGame:
+    def __init__(self, screen_size, hue_step=0.23, speed_step=110, slow_amount=70, power_up_rate=0.08,
+                 max_power_ups=5, high_score=0, spatial=None):
+        self.screen_size = screen_size
+
+        self.hue_step = hue_step
+        self.speed_step = speed_step
+        self.slow_amount = slow_amount
+        self.power_up_rate = power_up_rate
+        self.max_power_ups = max_power_ups
+
+        self.high_score = high_score
+        self.spatial = spatial if spatial is not None else SpatialGrid()
+        self.power_ups = []
+
+        self.on_score = None
+        self.on_death = None
+
+        self.reset()
+
+    def reset(self):
+        self.ball = Ball(self.screen_size)
+
+        self.player = pygame.Rect(self.screen_size[0] // 2 - self.screen_size[0] // 3,
+                                  self.screen_size[1] - 50, 75, 20)
+
+        self.color = (237, 205, 32)
+        self.score = 0
+        self.set_record = False
+        self.over = False
+        self.time = 0.0
+
+        self.colliding = False
+
+    def get_next_color(self):
+        r, g, b = [x / 255.0 for x in self.color]
+        h, l, s = colorsys.rgb_to_hls(r, g, b)
+
+        new_h = (h + self.hue_step) % 1.0  
+        new_r, new_g, new_b = colorsys.hls_to_rgb(new_h, l, s)
+
+        return (int(new_r * 255), int(new_g * 255), int(new_b * 255))
+
+    def move_paddle(self, x):
+        self.player.x = int(x) - self.player.width // 2
+
+        if self.player.left < 0:
+            self.player.left = 0
+        elif self.player.right > self.screen_size[0]:
+            self.player.right = self.screen_size[0]
+
+    def slow_ball(self, amount):
+        self.ball.ball_speed = max(200, self.ball.ball_speed - amount)
+
+    def on_paddle_hit(self, ball):
+        ball.on_collide(self.player)
+
+        self.score += 1
+
+        if self.score % 5 == 0:
+            self.color = self.get_next_color()
+            ball.ball_speed += self.speed_step
+
+        if self.score > self.high_score:
+            self.high_score = self.score
+            self.set_record = True
+
+        if self.on_score is not None:
+            self.on_score(self)
+
+    def on_power_up_hit(self, power_up):
+        power_up.apply_power(self.slow_amount)
+
+        self.power_ups.remove(power_up)
+        self.spatial.remove(power_up)
+
+    @staticmethod
+    def end(game):
+        game.over = True
+
+        if game.on_death is not None:
+            game.on_death(game)
+
+    def step(self, step):
+        reach = int(self.ball.ball_speed * step) + 1
+        candidates = self.spatial.query_rect(self.ball.rect.inflate(reach * 2, reach * 2))
+
+        # a paddle moved onto the ball scores once on entering the overlap and is ignored until they separate
+        colliding = self.ball.rect.colliderect(self.player)
+        if colliding and not self.colliding:
+            self.on_paddle_hit(self.ball)
+
+        self.colliding = colliding
+
+        obstacles = [] if colliding else [(self.player, self.on_paddle_hit)]
+        obstacles.extend((power_up.rect, lambda ball, power_up=power_up: self.on_power_up_hit(power_up))
+                         for power_up in candidates)
+
+        self.ball.update(step, self.screen_size, self.end, self, obstacles)
+        self.time += step
+
+        if self.over:
+            return
+
+        if random.random() < self.power_up_rate * step and len(self.power_ups) < self.max_power_ups:
+            power_up = PowerUp(
+                (random.randint(30, self.screen_size[0] - 30),
+                 random.randint(30, self.screen_size[1] - 200)),
+                self.slow_ball
+            )
+
+            self.power_ups.append(power_up)
+            self.spatial.insert(power_up, power_up.rect)
+
+class PongMaster(BaseApp):
+    reports_dirty = True
+    app_id = 'pong master'
+
+    event_routes = {
+        'menu': {pygame.MOUSEBUTTONDOWN: 'on_menu_click',
+                 (pygame.KEYDOWN, pygame.K_ESCAPE): 'on_home_key',
+                 (pygame.KEYDOWN, pygame.K_SPACE): 'on_start_key'},
+        'play': {pygame.QUIT: 'on_quit',
+                 (pygame.KEYDOWN, pygame.K_SPACE): 'on_pause_key'},
+        'pause': {pygame.QUIT: 'on_quit',
+                  pygame.MOUSEBUTTONDOWN: 'on_pause_click',
+                  (pygame.KEYDOWN, pygame.K_SPACE): 'on_resume_key',
+                  (pygame.KEYDOWN, pygame.K_ESCAPE): 'on_menu_key'},
+    }
+
+    def load_high_score(self):
+        return self.storage.get('high_score', 0)
+
+    def save_high_score(self, high_score):
+        self.storage.set('high_score', high_score)
+
+    @staticmethod
+    def change_lightness(color, amount):
+        r, g, b = [x / 255.0 for x in color]
+        h, l, s = colorsys.rgb_to_hls(r, g, b)
+
+        l = max(0, min(1, l + amount))
+        new_r, new_g, new_b = colorsys.hls_to_rgb(h, l, s)
+
+        return (int(new_r * 255), int(new_g * 255), int(new_b * 255))
+
+    def render_score_text(self, highscore=False):
+        if not highscore:
+            text = fonts.render_text(self.score_font, str(self.game.score), self.score_color)
+
+        else:
+            text = fonts.render_text(self.high_score_font, str(self.game.score), self.high_score_color)
+
+        return text
+
+    def render_pause_screen(self):
+        pause_screen = self.surfaces.new(self.screen_size, pygame.SRCALPHA)
+
+        title_font = fonts.get_font('bauhaus93', self.screen_size[0] // 7)
+        button_font = fonts.get_font('bauhaus93', self.screen_size[0] // 10)
+
+        self.resume_rect = pygame.Rect(self.screen.get_width() // 2 - 100, self.screen.get_height() * 0.8 - 50, 200, 100)
+        self.menu_rect = pygame.Rect(self.screen.get_width() // 2 - 100, self.screen.get_height() * 0.8 - 180, 200, 100)
+
+        self.pause_panel = Panel(pause_screen, [
+            Label(title_font, "Paused", (255, 255, 255), (self.screen.get_width() // 2, 100), 'midtop'),
+            Button(self.resume_rect, button_font, "Resume", (255, 255, 255), (30, 30, 30)),
+            Button(self.menu_rect, button_font, "Menu", (255, 255, 255), (30, 30, 30)),
+        ], fill=(0, 0, 0))
+
+        return self.pause_panel.get_surface()
+
+    def start_game(self):
+        self.scope = 'play'
+        self.keys_utilities = self.scope_to_utilities[self.scope]
+
+        self.game.reset()
+
+        self.score_color = self.change_lightness(self.game.color, -0.3)
+        self.high_score_color = self.change_lightness(self.game.color, 0.3)
+
+        self.score_text = self.render_score_text()
+
+        self.anim_alpha = 0.0
+
+        self.capture_pointer()
+
+    def pause(self):
+        self.release_pointer()
+        self.scope = 'pause'
+        self.keys_utilities = self.scope_to_utilities[self.scope]
+
+        self.anim_alpha = 0
+        self.snapshot()
+
+    def snapshot(self):
+        self.surfaces.release(self.last_frame)
+        self.last_frame = self.surfaces.copy(self.screen)
+
+    def on_suspend(self):
+        if self.scope == 'play':
+            self.pause()
+
+        if self.game.set_record:
+            self.save_high_score(self.game.high_score)
+
+        self.release_pointer()
+
+    def on_death(self, game):
+        self.scope = 'menu'
+        self.keys_utilities = self.scope_to_utilities[self.scope]
+
+        self.snapshot()
+
+        self.storage.submit_score(game.score)
+
+        if game.set_record:
+            self.save_high_score(game.high_score)
+
+        self.render_menu_screen()
+
+        self.release_pointer()
+
+    def __init__(self, set_active_app, *args, stress_balls=0, **kwargs):
+        scope_to_utilities = {'menu': [{'text': 'press space to start', 'key': 'space'},
+                                        {'text': 'press esc to quit', 'key': 'esc'}],
+                               'play': [{'text': 'move the mouse to control the paddle', 'key': 'mouse'},
+                                         {'text': 'press space to pause', 'key': 'space'}],
+                               'pause': [{'text': 'press space to resume', 'key': 'space'},
+                                         {'text': 'press esc to return to menu', 'key': 'esc'}]}
+
+        super().__init__(set_active_app, scope='menu', scope_to_utilities=scope_to_utilities)
+
+        self.pause_screen = self.render_pause_screen()
+        self.last_frame = self.surfaces.copy(self.screen)
+        self.anim_alpha = 255.0
+
+        self.rendered_scope = None
+        self.rendered_color = None
+        self.rendered_alpha = None
+        self.play_rects = []
+
+        self.player_surf = pygame.Surface((75, 20))
+        self.player_surf.fill((255, 255, 255))
+        pygame.draw.rect(self.player_surf, (0, 0, 0), (10, 0, 50, 20))
+        pygame.draw.ellipse(self.player_surf, (0, 0, 0), (0, 0, 25, 20))
+        pygame.draw.ellipse(self.player_surf, (0, 0, 0), (50, 0, 25, 20))
+        self.player_surf.set_colorkey((255, 255, 255))
+        self.power_up_surf = PowerUp.render_power_up()
+
+        self.game = PongGame(self.screen_size, hue_step=0.23, high_score=self.load_high_score(), spatial=self.spatial)
+        self.game.on_score = self.on_score
+        self.game.on_death = self.on_death
+
+        self.score_font = fonts.get_font('bauhaus93', self.screen_size[1] // 8)
+        self.high_score_font = fonts.get_font('bauhaus93', self.screen_size[1] // 5)
+
+        self.menu = self.surfaces.new(self.screen_size)
+        self.menu_screen = self.surfaces.new(self.screen_size, pygame.SRCALPHA)
+        self.build_menu()
+        self.render_menu_screen()
+
+        if np is not None:
+            self.menu_balls = BallSystem(self.screen_size, trail_sprites)
+
+        else:
+            self.menu_balls = BallList(self.screen_size)
+
+        angles = [math.radians(angle + random.randint(-10, 10)) for angle in range(0, 360, 36)]
+        self.menu_balls.spawn(angles, [float(random.randint(250, 800)) for _ in angles], (6, 6, 116))
+
+        if stress_balls:
+            self.menu_balls.spawn([random.uniform(0, 2 * math.pi) for _ in range(stress_balls)],
+                                  [random.uniform(250, 800) for _ in range(stress_balls)], (6, 6, 116))
+
+        self.menu_balls.spawn([math.radians(135)], [550.0], (180, 195, 255))
+
+    def build_menu(self):
+        color = (180, 195, 255)
+        button_font = fonts.get_font('bauhaus93', self.screen_size[0] // 10)
+
+        self.play_rect = pygame.Rect(self.screen.get_width() // 2 - 100, self.screen.get_height() * 0.8 - 50, 200, 100)
+        self.quit_rect = pygame.Rect(self.screen.get_width() // 2 - 100, self.screen.get_height() * 0.8 - 180, 200, 100)
+
+        self.high_score_label = Label(fonts.get_font('bauhaus93', self.screen_size[0] // 20), "Highscore:", color)
+        self.high_score_value = Label(self.high_score_font, '', color,
+                                      (self.menu.get_width() // 2, self.menu.get_height() // 2 - 150), 'midtop')
+
+        self.menu_panel = Panel(self.menu, [
+            Label(fonts.get_font('bauhaus93', self.screen_size[0] // 7), "Pong Master", color,
+                  (self.menu.get_width() // 2, self.menu.get_height() // 2 - 250), 'midtop'),
+            self.high_score_label,
+            self.high_score_value,
+            Button(self.play_rect, button_font, "Play", color, (15, 15, 130)),
+            Button(self.quit_rect, button_font, "Quit", color, (15, 15, 130)),
+        ], fill=(0, 0, 0))
+
+        self.menu.set_colorkey((0, 0, 0))
+
+    def render_menu_screen(self):
+        self.high_score_value.text = str(self.game.high_score)
+        self.high_score_label.pos = (self.high_score_value.rect.x, self.menu.get_height() // 2 - 155)
+
+        self.menu_panel.get_surface()
+
+    def on_score(self, game):
+        if game.score % 5 == 0:
+            self.score_color = self.change_lightness(game.color, -0.2)
+            self.high_score_color = self.change_lightness(game.color, 0.2)
+
+        self.score_text = self.render_score_text(game.set_record)
+
+    def update(self, step):
+        if self.scope == 'play':
+            self.game.move_paddle(self.mouse[0])
+            self.game.step(step)
+
+            if self.scope != 'play':
+                return
+
+            self.game.ball.update_trail(step)
+
+        elif self.scope == 'menu':
+            self.menu_balls.update(step)
+
+    def play(self):
+        game = self.game
+
+        self.screen.fill(game.color)
+
+        score_rect = self.screen.blit(self.score_text, (
+            self.screen.get_width() // 2 - self.score_text.get_width() // 2,
+            self.screen.get_height() // 2 - self.score_text.get_height() // 2
+        ))
+
+        for power_up in game.power_ups:
+            self.screen.blit(self.power_up_surf, power_up.rect)
+
+        game.ball.draw_trail(self.screen)
+        game.ball.draw(self.screen, self.interpolation)
+
+        self.screen.blit(self.player_surf, game.player)
+
+        play_rects = [score_rect, game.player.copy(), game.ball.dirty_rect(self.interpolation)]
+        play_rects.extend(power_up.rect for power_up in game.power_ups)
+
+        if self.rendered_color != game.color:
+            self.rendered_color = game.color
+            self.mark_dirty()
+
+        else:
+            self.mark_dirty(*self.play_rects, *play_rects)
+
+        self.play_rects = play_rects
+
+    def run(self, display):
+        delta = self.delta
+
+        if self.scope != self.rendered_scope:
+            self.rendered_scope = self.scope
+            self.rendered_color = None
+            self.rendered_alpha = None
+
+        if self.scope == 'play':
+            self.play()
+
+        elif self.scope == 'pause':
+            if self.rendered_alpha == PAUSE_ALPHA:
+                return
+
+            self.screen.fill((0, 0, 0))
+            self.animate(delta, self.pause_screen, max_alpha=PAUSE_ALPHA)
+            self.screen.blit(self.pause_screen, (0, 0))
+            self.mark_dirty()
+
+            self.rendered_alpha = self.anim_alpha
+
+        elif self.scope == 'menu':
+            self.menu_screen.fill((0, 0, 98))
+
+
+            self.menu_balls.draw(self.menu_screen, self.interpolation)
+
+            self.menu_screen.blit(self.menu, (0, 0))
+
+            self.screen.fill((0, 0, 0))
+            self.screen.blit(self.last_frame, (0, 0))
+            self.animate(delta, self.menu_screen, max_alpha=255)
+            self.screen.blit(self.menu_screen, (0, 0))
+            self.mark_dirty()
+
+    def is_idle(self):
+        return self.scope == 'pause' and self.rendered_alpha == PAUSE_ALPHA
+
+    def animate(self, delta, surface, max_alpha):
+        self.screen.blit(self.last_frame, (0, 0))
+        self.anim_alpha = min(max_alpha, self.anim_alpha + 400 * delta)
+        surface.set_alpha(int(self.anim_alpha))
+
+    def on_quit(self, event):
+        self.save_high_score(self.game.high_score)
+
+    def on_pause_key(self, event):
+        self.pause()
+
+    def resume(self):
+        self.capture_pointer()
+        self.scope = 'play'
+        self.keys_utilities = self.scope_to_utilities[self.scope]
+
+    def back_to_menu(self):
+        self.scope = 'menu'
+        self.keys_utilities = self.scope_to_utilities[self.scope]
+
+        self.anim_alpha = 0
+        self.snapshot()
+
+        if self.game.set_record:
+            self.save_high_score(self.game.high_score)
+
+    def on_resume_key(self, event):
+        self.resume()
+
+    def on_menu_key(self, event):
+        self.back_to_menu()
+
+    def on_pause_click(self, event):
+        if self.resume_rect.collidepoint(self.mouse):
+            self.resume()
+
+            self.anim_alpha = 0
+
+        if self.menu_rect.collidepoint(self.mouse):
+            self.back_to_menu()
+
+    def on_menu_click(self, event):
+        if self.play_rect.collidepoint(self.mouse):
+            self.start_game()
+
+        elif self.quit_rect.collidepoint(self.mouse):
+            self.save_high_score(self.game.high_score)
+            self.set_active_app('home')
+
+    def on_home_key(self, event):
+        self.set_active_app('home')
+
+    def on_start_key(self, event):
+        self.start_game()
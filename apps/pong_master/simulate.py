@@ -0,0 +1,190 @@
+import os
+import csv
+import sys
+import math
+import random
+import argparse
+import importlib
+import itertools
+import collections
+
+from concurrent.futures import ProcessPoolExecutor
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+from .pong_master import PongGame
+
+SCREEN_SIZE = (300, 600)
+SIMULATION_RATE = 120
+
+POLICIES = {
+    'perfect': {'speed': math.inf, 'reaction': 0.0, 'jitter': 0.0},
+    'human': {'speed': 1400.0, 'reaction': 0.12, 'jitter': 12.0},
+    'novice': {'speed': 800.0, 'reaction': 0.2, 'jitter': 25.0},
+}
+
+SWEEP_PARAMETERS = ('hue_step', 'speed_step', 'slow_amount', 'power_up_rate')
+
+class Autopilot:
+    def __init__(self, rng, speed=math.inf, reaction=0.0, jitter=0.0):
+        self.rng = rng
+        self.speed = speed
+        self.reaction = reaction
+        self.jitter = jitter
+
+        self.seen = collections.deque()
+        self.offset = 0.0
+        self.score = None
+
+    def __call__(self, game, step):
+        self.seen.append((game.time, game.ball.rect.centerx))
+        while len(self.seen) > 1 and self.seen[1][0] <= game.time - self.reaction:
+            self.seen.popleft()
+
+        if game.score != self.score:
+            self.score = game.score
+            self.offset = self.rng.gauss(0.0, self.jitter) if self.jitter else 0.0
+
+        target = self.seen[0][1] + self.offset
+        reach = self.speed * step
+
+        return game.player.centerx + max(-reach, min(reach, target - game.player.centerx))
+
+def load_policy(name):
+    if name in POLICIES:
+        return lambda rng: Autopilot(rng, **POLICIES[name])
+
+    module_name, _, attribute = name.partition(':')
+    return getattr(importlib.import_module(module_name), attribute)
+
+def play_game(task):
+    config, policy_name, seed, max_time, rate = task
+
+    random.seed(seed)
+    policy = load_policy(policy_name)(random.Random(seed))
+
+    game = PongGame(SCREEN_SIZE, **config)
+    step = 1 / rate
+
+    while not game.over and game.time < max_time:
+        game.move_paddle(policy(game, step))
+        game.step(step)
+
+    return game.score, game.time, not game.over
+
+def place_ball(game, pos, angle):
+    game.ball.ball_pos[:] = pos
+    game.ball.rect.topleft = pos
+    game.ball.ball_angle = angle
+
+def check_paddle_hits():
+    failures = []
+
+    # the paddle moves onto a ball that is already level with it: one hit, then none until they separate
+    game = PongGame(SCREEN_SIZE)
+    place_ball(game, (40, 552), 0.0)
+    game.move_paddle(200)
+    game.move_paddle(50)
+
+    for _ in range(SIMULATION_RATE // 2):
+        game.step(1 / SIMULATION_RATE)
+
+    if game.score != 1 or game.over:
+        failures.append(f'paddle moved onto the ball scored {game.score} instead of 1')
+
+    # a ball falling onto a still paddle scores exactly once and bounces
+    game = PongGame(SCREEN_SIZE)
+    place_ball(game, (game.player.centerx - game.ball.rect.width // 2, game.player.top - 40), 0.0)
+
+    for _ in range(SIMULATION_RATE // 2):
+        game.step(1 / SIMULATION_RATE)
+
+    if game.score != 1 or game.over:
+        failures.append(f'ball dropped onto the paddle scored {game.score} instead of 1')
+
+    return failures
+
+def summarize(config, results):
+    from benchmark import percentile
+
+    scores = [score for score, _, _ in results]
+    lengths = [length for _, length, _ in results]
+
+    return {
+        **config,
+        'games': len(results),
+        'score_mean': sum(scores) / len(scores),
+        'score_p10': percentile(scores, 10),
+        'score_p50': percentile(scores, 50),
+        'score_p90': percentile(scores, 90),
+        'score_max': max(scores),
+        'length_mean_s': sum(lengths) / len(lengths),
+        'length_p50_s': percentile(lengths, 50),
+        'length_p90_s': percentile(lengths, 90),
+        'capped': sum(capped for _, _, capped in results),
+    }
+
+def format_table(rows):
+    columns = list(rows[0])
+    cells = [[f'{row[column]:.2f}' if isinstance(row[column], float) else str(row[column]) for column in columns]
+             for row in rows]
+    widths = [max(len(column), *(len(row[i]) for row in cells)) for i, column in enumerate(columns)]
+
+    lines = ['  '.join(column.rjust(width) for column, width in zip(columns, widths))]
+    lines.extend('  '.join(cell.rjust(width) for cell, width in zip(row, widths)) for row in cells)
+
+    return '\n'.join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Play seeded Pong Master games headlessly with an autopilot paddle '
+                                                 'and report score and game length distributions.')
+    parser.add_argument('--games', type=int, default=1000, help='games per configuration')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the first game')
+    parser.add_argument('--policy', default='human',
+                        help=f'autopilot preset ({", ".join(POLICIES)}) or module:factory taking a random.Random')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--max-time', type=float, default=600.0, help='simulated seconds before a game is capped')
+    parser.add_argument('--rate', type=int, default=SIMULATION_RATE, help='simulation steps per second')
+    parser.add_argument('--hue-step', type=float, nargs='+', default=[0.23])
+    parser.add_argument('--speed-step', type=float, nargs='+', default=[110.0])
+    parser.add_argument('--slow-amount', type=float, nargs='+', default=[70.0])
+    parser.add_argument('--power-up-rate', type=float, nargs='+', default=[0.08])
+    parser.add_argument('--csv', metavar='PATH', help='also write the results table to PATH')
+    parser.add_argument('--check', action='store_true',
+                        help='only run the paddle collision regression checks; exits with 1 on failure')
+    args = parser.parse_args(argv)
+
+    if args.check:
+        failures = check_paddle_hits()
+
+        for failure in failures:
+            print('failed:', failure, file=sys.stderr)
+
+        return 1 if failures else 0
+
+    try:
+        load_policy(args.policy)
+
+    except (ImportError, AttributeError, ValueError):
+        parser.error(f'unknown policy {args.policy!r}')
+
+    configs = [dict(zip(SWEEP_PARAMETERS, values))
+               for values in itertools.product(*(getattr(args, name) for name in SWEEP_PARAMETERS))]
+    tasks = [(config, args.policy, args.seed + i, args.max_time, args.rate)
+             for config in configs for i in range(args.games)]
+
+    with ProcessPoolExecutor(args.workers) as executor:
+        results = list(executor.map(play_game, tasks, chunksize=max(1, len(tasks) // 256)))
+
+    rows = [summarize(config, results[i * args.games:(i + 1) * args.games]) for i, config in enumerate(configs)]
+
+    print(format_table(rows))
+
+    if args.csv:
+        with open(args.csv, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+
+if __name__ == '__main__':
+    sys.exit(main())
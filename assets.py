@@ -0,0 +1,90 @@
+import os
+import mmap
+import glob
+import struct
+import hashlib
+import tempfile
+import pygame
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(PACKAGE_DIR, '.cache', 'assets')
+
+RAW_HEADER = struct.Struct('<II')
+
+images = {}
+masks = {}
+
+def asset_path(*parts):
+    return os.path.join(PACKAGE_DIR, *parts)
+
+def raw_cache_prefix(path):
+    return os.path.join(CACHE_DIR, hashlib.sha1(os.path.abspath(path).encode()).hexdigest()[:16])
+
+def read_raw(path):
+    cache_path = f'{raw_cache_prefix(path)}-{os.stat(path).st_mtime_ns}.rgba'
+
+    try:
+        with open(cache_path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    except (OSError, ValueError):
+        return None
+
+    width, height = RAW_HEADER.unpack_from(mapped)
+    if len(mapped) != RAW_HEADER.size + width * height * 4:
+        return None
+
+    return pygame.image.frombuffer(memoryview(mapped)[RAW_HEADER.size:], (width, height), 'RGBA')
+
+def write_raw(path, surface):
+    prefix = raw_cache_prefix(path)
+    cache_path = f'{prefix}-{os.stat(path).st_mtime_ns}.rgba'
+
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+
+        for stale_path in glob.glob(f'{prefix}-*.rgba'):
+            os.remove(stale_path)
+
+        fd, temp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(RAW_HEADER.pack(*surface.get_size()))
+            f.write(pygame.image.tobytes(surface, 'RGBA'))
+
+        os.replace(temp_path, cache_path)
+
+    except OSError:
+        pass
+
+def load_image(path, alpha=True, colorkey=None):
+    key = (path, alpha, colorkey)
+
+    image = images.get(key)
+    if image is not None:
+        return image
+
+    image = read_raw(path)
+    if image is None:
+        image = pygame.image.load(path)
+        write_raw(path, image)
+
+    if pygame.display.get_surface() is not None:
+        image = image.convert_alpha() if alpha else image.convert()
+
+    if colorkey is not None:
+        image.set_colorkey(colorkey, pygame.RLEACCEL)
+
+    images[key] = image
+    return image
+
+def rounded_mask(size, radius):
+    key = (tuple(size), radius)
+
+    mask = masks.get(key)
+    if mask is None:
+        mask = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(mask, (255, 255, 255), mask.get_rect(), border_radius=radius)
+
+        masks[key] = mask
+
+    return mask
@@ -0,0 +1,60 @@
+import asyncio
+
+from concurrent.futures import ThreadPoolExecutor
+
+MAX_WORKERS = 2
+
+executor = None
+pending = set()
+
+def get_executor():
+    global executor
+
+    if executor is None:
+        executor = ThreadPoolExecutor(MAX_WORKERS, thread_name_prefix='app-job')
+
+    return executor
+
+def deliver(future, on_done, on_error):
+    if future.cancelled():
+        return
+
+    exception = future.exception()
+    if exception is None:
+        if on_done is not None:
+            on_done(future.result())
+
+    elif on_error is not None:
+        on_error(exception)
+
+    else:
+        raise exception
+
+def track(future, on_done=None, on_error=None):
+    pending.add(future)
+    future.add_done_callback(pending.discard)
+
+    # done callbacks run on the loop, so results and errors reach the app on the main thread between frames
+    if on_done is not None or on_error is not None:
+        future.add_done_callback(lambda future: deliver(future, on_done, on_error))
+
+    return future
+
+def start_task(coroutine, on_done=None, on_error=None):
+    return track(asyncio.get_event_loop().create_task(coroutine), on_done, on_error)
+
+def run_in_thread(function, *args, on_done=None, on_error=None):
+    return track(asyncio.get_event_loop().run_in_executor(get_executor(), function, *args), on_done, on_error)
+
+def busy():
+    return bool(pending)
+
+def shutdown():
+    global executor
+
+    for future in list(pending):
+        future.cancel()
+
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+        executor = None
@@ -1,45 +1,151 @@
-import pygame
-
-from abc import ABC, abstractmethod
-
-class BaseApp(ABC):
-    def __init__(self, set_active_app, keys_utilities=None, scope=None, scope_to_utilities=None):
-        pygame.init()
-        self.screen_size = (300, 600)
-        self.screen = pygame.Surface(self.screen_size)
-
-        self.clock = pygame.time.Clock()
-        self.mouse = pygame.mouse.get_pos()
-
-        self.set_active_app = set_active_app
-        
-        if scope is not None:
-            self.scope = scope
-
-        if scope_to_utilities is not None:
-            self.scope_to_utilities = scope_to_utilities
-
-        if keys_utilities is not None:
-            self.keys_utilities = keys_utilities
-
-        else:
-            if scope_to_utilities is not None and scope is not None:
-                self.keys_utilities = scope_to_utilities[scope]
-
-            else:
-                raise AttributeError('keys_utilities must be provided or scope_to_utilities and scope must be set.', self)
-
-    @abstractmethod
-    def run(self, display):
-        ...
-
-    @abstractmethod
-    def events(self, event):
-        ...
-
-    def get_relative_mouse_pos(self, display):
-        self.mouse = pygame.mouse.get_pos()
-        self.mouse = (
-            self.mouse[0] - display.get_width() // 2 + self.screen.get_width() // 2,
-            self.mouse[1] - display.get_height() // 2 + self.screen.get_height() // 2
-        )
\ No newline at end of file
+import pygame
+
+from abc import ABC, abstractmethod
+
+from spatial import SpatialGrid
+import background
+import surface_pool
+import storage
+
+KEY_EVENTS = (pygame.KEYDOWN, pygame.KEYUP)
+
+class BaseApp(ABC):
+    reports_dirty = False
+    app_id = None
+    scope = None
+
+    # {scope: {event type or (key event type, key): method name}}, None handles events() by hand
+    event_routes = None
+
+    def __init__(self, set_active_app, keys_utilities=None, scope=None, scope_to_utilities=None):
+        pygame.init()
+        self.screen_size = (300, 600)
+
+        self.surfaces = surface_pool.SurfaceAllocator(surface_pool.pool)
+        self.screen = self.surfaces.new(self.screen_size)
+
+        self.mouse = (0, 0)
+        self.pointer_captured = False
+
+        self.delta = 0.0
+        self.interpolation = 1.0
+
+        self.dirty_rects = []
+        self.jobs = set()
+
+        self.spatial = SpatialGrid()
+        self.routes = self.build_routes()
+
+        self.storage = storage.get_store().namespace(self.app_id or type(self).__name__)
+
+        self.set_active_app = set_active_app
+        
+        if scope is not None:
+            self.scope = scope
+
+        if scope_to_utilities is not None:
+            self.scope_to_utilities = scope_to_utilities
+
+        if keys_utilities is not None:
+            self.keys_utilities = keys_utilities
+
+        else:
+            if scope_to_utilities is not None and scope is not None:
+                self.keys_utilities = scope_to_utilities[scope]
+
+            else:
+                raise AttributeError('keys_utilities must be provided or scope_to_utilities and scope must be set.', self)
+
+    @abstractmethod
+    def run(self, display):
+        ...
+
+    def build_routes(self):
+        if self.event_routes is None:
+            return {}
+
+        return {scope: {route: getattr(self, name) for route, name in routes.items()}
+                for scope, routes in self.event_routes.items()}
+
+    def event_types(self):
+        if self.event_routes is None:
+            return None
+
+        return {route[0] if isinstance(route, tuple) else route
+                for routes in self.event_routes.values() for route in routes}
+
+    def events(self, event):
+        routes = self.routes.get(self.scope)
+        if routes is None:
+            return
+
+        handler = None
+        if event.type in KEY_EVENTS:
+            handler = routes.get((event.type, event.key))
+
+        if handler is None:
+            handler = routes.get(event.type)
+
+        if handler is not None:
+            handler(event)
+
+    def update(self, step):
+        ...
+
+    def on_suspend(self):
+        ...
+
+    def on_resume(self):
+        self.mark_dirty()
+
+    def is_idle(self):
+        return False
+
+    def surface_bytes(self):
+        return self.surfaces.live_bytes
+
+    def memory_usage(self):
+        total = self.surface_bytes()
+
+        for value in vars(self).values():
+            if isinstance(value, dict):
+                value = value.values()
+
+            elif not isinstance(value, (list, tuple)):
+                value = (value,)
+
+            for item in value:
+                if isinstance(item, pygame.Surface) and not self.surfaces.owns(item):
+                    total += surface_pool.surface_bytes(item)
+
+        return total
+
+    def start_task(self, coroutine, on_done=None, on_error=None):
+        return self.track_job(background.start_task(coroutine, on_done, on_error))
+
+    def run_in_thread(self, function, *args, on_done=None, on_error=None):
+        return self.track_job(background.run_in_thread(function, *args, on_done=on_done, on_error=on_error))
+
+    def track_job(self, future):
+        self.jobs.add(future)
+        future.add_done_callback(self.jobs.discard)
+
+        return future
+
+    def close(self):
+        for job in list(self.jobs):
+            job.cancel()
+
+        self.surfaces.release_all()
+
+    def mark_dirty(self, *rects):
+        if not rects:
+            rects = (self.screen.get_rect(),)
+
+        self.dirty_rects.extend(pygame.Rect(rect) for rect in rects)
+
+    def capture_pointer(self):
+        self.pointer_captured = True
+
+    def release_pointer(self):
+        self.pointer_captured = False
\ No newline at end of file
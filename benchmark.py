@@ -0,0 +1,397 @@
+import os
+import sys
+import gc
+import json
+import math
+import time
+import zlib
+import random
+import asyncio
+import argparse
+import tempfile
+import tracemalloc
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('SDL_RENDER_DRIVER', 'software')
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pygame
+import storage
+import surface_pool
+
+DISPLAY_SIZE = (1366, 768)
+TEXTURE_WINDOW_SIZE = (3840, 2160)
+FRAME_DELTA = 1 / 60
+STRESS_BALLS = 5000
+CATALOG_SIZE = 500
+
+CADENCE_FPS = 60
+CADENCE_JOB_BYTES = 2 * 1024 * 1024
+CADENCE_SLICE_S = 0.001
+CADENCE_LATE_FACTOR = 1.5
+CADENCE_MAX_LATE = 0.02
+
+def percentile(values, p):
+    values = sorted(values)
+    index = (len(values) - 1) * p / 100
+    low, high = math.floor(index), math.ceil(index)
+
+    return values[low] + (values[high] - values[low]) * (index - low)
+
+def mouse_motion(frame, display):
+    x = display.get_width() // 2 + int(140 * math.sin(frame / 20))
+    y = display.get_height() // 2 + int(280 * math.cos(frame / 35))
+
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=(x, y), rel=(0, 0), buttons=(0, 0, 0))
+
+def key_down(key):
+    return pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode='', scancode=0)
+
+class AppScenario:
+    def __init__(self, name, make_app, prepare=None, script=None):
+        self.name = name
+        self.make_app = make_app
+        self.prepare = prepare
+        self.script = script
+
+    def setup(self, display):
+        self.display = display
+        self.app = self.make_app(lambda app_name: None)
+
+        if self.prepare is not None:
+            self.prepare(self.app)
+
+    def frame(self, frame):
+        app = self.app
+
+        events = [mouse_motion(frame, self.display)]
+        app.mouse = (events[0].pos[0] - self.display.get_width() // 2 + app.screen.get_width() // 2,
+                     events[0].pos[1] - self.display.get_height() // 2 + app.screen.get_height() // 2)
+        if self.script is not None:
+            events.extend(self.script(app, frame))
+
+        for event in events:
+            app.events(event)
+
+        steps = round(FRAME_DELTA * 120)
+        for _ in range(steps):
+            app.update(FRAME_DELTA / steps)
+
+        app.delta = FRAME_DELTA
+        app.interpolation = 1.0
+
+        app.run(self.display)
+        app.dirty_rects.clear()
+
+class ShellScenario:
+    name = 'shell'
+    backend = 'surface'
+
+    def setup(self, display):
+        import phone
+
+        if self.backend == 'texture':
+            from pygame._sdl2 import video
+
+            # a window that already has a software display surface can't get a renderer
+            size = display.get_size()
+            pygame.display.quit()
+            pygame.display.init()
+
+            display = pygame.display.set_mode(size, pygame.SCALED)
+            video.Window.from_display_module().size = TEXTURE_WINDOW_SIZE
+
+        self.display = display
+        self.phone = phone.Phone(display, backend=self.backend)
+
+    def frame(self, frame):
+        events = [mouse_motion(frame, self.display)]
+
+        if frame == 60:
+            self.phone.set_active_app('pong master')
+
+        elif frame in (120, 180, 240):
+            events.append(key_down(pygame.K_SPACE))
+
+        self.phone.frame(events, FRAME_DELTA)
+
+class TextureShellScenario(ShellScenario):
+    name = 'shell-texture'
+    backend = 'texture'
+
+def pong_scenario(scope, stress_balls=0):
+    from apps.pong_master import pong_master
+
+    def prepare(app):
+        if scope in ('play', 'pause', 'cycle'):
+            app.start_game()
+
+        if scope == 'pause':
+            app.events(key_down(pygame.K_SPACE))
+
+    def script(app, frame):
+        if scope == 'play' and app.scope != 'play':
+            app.start_game()
+
+        if scope == 'cycle':
+            # pause and resume every half second, restarting whenever the ball is lost
+            if app.scope == 'menu':
+                app.start_game()
+
+            if frame % 30 == 0:
+                return [key_down(pygame.K_SPACE)]
+
+        return []
+
+    return AppScenario('pong-' + scope, lambda set_active_app: pong_master.PongMaster(set_active_app,
+                                                                                     stress_balls=stress_balls),
+                       prepare, script)
+
+def home_scenario(catalog_size=0):
+    import phone
+    import registry
+
+    phone_apps = {'home': phone.Home}
+    phone_apps.update(registry.discover())
+
+    # every tile gets its own entry, so the scenario pays for each icon load like a real catalog would
+    entries = list(phone_apps.values())[1:]
+    for i in range(catalog_size):
+        entry = entries[i % len(entries)]
+        phone_apps[f'game {i}'] = registry.AppEntry(f'game {i}', entry.path, entry.entry, entry.icon_path)
+
+    def script(app, frame):
+        # alternate dragging the grid with letting it fling
+        if frame % 120 == 0:
+            return [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(0, 0), button=1)]
+
+        if frame % 120 == 60:
+            return [pygame.event.Event(pygame.MOUSEBUTTONUP, pos=(0, 0), button=1)]
+
+        return []
+
+    return AppScenario('home-catalog' if catalog_size else 'home',
+                       lambda set_active_app: phone.Home(set_active_app, phone_apps),
+                       script=script if catalog_size else None)
+
+SCENARIOS = {
+    'home': home_scenario,
+    'home-catalog': lambda: home_scenario(CATALOG_SIZE),
+    'pong-menu': lambda: pong_scenario('menu'),
+    'pong-play': lambda: pong_scenario('play'),
+    'pong-pause': lambda: pong_scenario('pause'),
+    'pong-cycle': lambda: pong_scenario('cycle'),
+    'pong-stress': lambda: pong_scenario('menu', stress_balls=STRESS_BALLS),
+    'shell': ShellScenario,
+    'shell-texture': TextureShellScenario,
+}
+
+def measure(scenario, display, frames, warmup):
+    random.seed(0)
+
+    start = time.perf_counter()
+    scenario.setup(display)
+    startup = time.perf_counter() - start
+
+    for frame in range(warmup):
+        scenario.frame(frame)
+
+    gc_before = gc.get_stats()[0]['collections']
+    blocks_before = sys.getallocatedblocks()
+    surfaces_before = surface_pool.pool.created
+
+    frame_times = []
+    for frame in range(warmup, warmup + frames):
+        start = time.perf_counter()
+        scenario.frame(frame)
+        frame_times.append((time.perf_counter() - start) * 1000)
+
+    net_blocks = sys.getallocatedblocks() - blocks_before
+    gc_collections = gc.get_stats()[0]['collections'] - gc_before
+    surfaces_created = surface_pool.pool.created - surfaces_before
+
+    tracemalloc.start()
+    alloc_bytes = []
+    for frame in range(warmup + frames, warmup + frames * 2):
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+
+        scenario.frame(frame)
+        alloc_bytes.append(tracemalloc.get_traced_memory()[1] - current)
+
+    tracemalloc.stop()
+
+    return {
+        'frames': frames,
+        'startup_ms': startup * 1000,
+        'frame_ms': {
+            'mean': sum(frame_times) / len(frame_times),
+            'p50': percentile(frame_times, 50),
+            'p95': percentile(frame_times, 95),
+            'p99': percentile(frame_times, 99),
+            'max': max(frame_times),
+        },
+        'alloc_bytes_per_frame': sum(alloc_bytes) / len(alloc_bytes),
+        'net_blocks_per_frame': net_blocks / frames,
+        'gc_collections_per_frame': gc_collections / frames,
+        'surfaces_created_per_frame': surfaces_created / frames,
+    }
+
+def cadence(display, seconds, background_work):
+    import phone
+    from apps.pong_master.pong_master import PongGame
+
+    random.seed(0)
+
+    shell = phone.Phone(display, target_fps=CADENCE_FPS, seed=0)
+    shell.set_active_app('pong master')
+    app = shell.app
+
+    frame_starts = []
+    frame = shell.frame
+
+    def timed_frame(*args):
+        frame_starts.append(time.perf_counter())
+        frame(*args)
+
+    shell.frame = timed_frame
+
+    work = {'jobs': 0, 'slices': 0}
+
+    if background_work:
+        payload = random.randbytes(CADENCE_JOB_BYTES)
+
+        def compress():
+            return zlib.compress(payload, 6)
+
+        def compressed(result):
+            work['jobs'] += 1
+            app.run_in_thread(compress, on_done=compressed)
+
+        async def precompute():
+            # simulates level precomputation, yielding to the frame loop every slice
+            game = PongGame(app.screen_size)
+
+            while True:
+                deadline = time.perf_counter() + CADENCE_SLICE_S
+                while time.perf_counter() < deadline:
+                    game.move_paddle(game.ball.rect.centerx)
+                    game.step(1 / 120)
+
+                    if game.over:
+                        game.reset()
+
+                work['slices'] += 1
+                await asyncio.sleep(0)
+
+        app.run_in_thread(compress, on_done=compressed)
+        app.start_task(precompute())
+
+    shell.loop.call_later(seconds, setattr, shell, 'running', False)
+    shell.run()
+
+    period = 1000 / CADENCE_FPS
+    intervals = [(b - a) * 1000 for a, b in zip(frame_starts, frame_starts[1:])]
+    late = sum(interval > period * CADENCE_LATE_FACTOR for interval in intervals)
+
+    return {
+        'frames': len(frame_starts),
+        'interval_ms': {
+            'mean': sum(intervals) / len(intervals),
+            'p50': percentile(intervals, 50),
+            'p95': percentile(intervals, 95),
+            'p99': percentile(intervals, 99),
+            'max': max(intervals),
+        },
+        'late_frames': late,
+        'late_ratio': late / len(intervals),
+        'jobs_completed': work['jobs'],
+        'coroutine_slices': work['slices'],
+    }
+
+def compare(results, baseline, tolerance):
+    regressions = []
+
+    for name, result in results['scenarios'].items():
+        if name not in baseline.get('scenarios', {}):
+            continue
+
+        for key in ('p50', 'p95', 'p99'):
+            before = baseline['scenarios'][name]['frame_ms'][key]
+            after = result['frame_ms'][key]
+
+            if after > before * (1 + tolerance):
+                regressions.append(f'{name} frame_ms.{key}: {before:.3f} -> {after:.3f}')
+
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Headless benchmark for the phone shell and its apps.')
+    parser.add_argument('scenarios', nargs='*', help='scenarios to run, out of: ' + ', '.join(SCENARIOS))
+    parser.add_argument('--frames', type=int, default=600)
+    parser.add_argument('--warmup', type=int, default=60)
+    parser.add_argument('--output', help='write the JSON report to this file instead of stdout')
+    parser.add_argument('--baseline', help='JSON report to compare against; exits with 1 on regressions')
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    parser.add_argument('--cadence', type=float, metavar='SECONDS',
+                        help='instead of the scenarios, run the shell loop in real time with and without background '
+                             'jobs and coroutines; exits with 1 if frames miss their slot under load')
+    args = parser.parse_args(argv)
+
+    for name in args.scenarios:
+        if name not in SCENARIOS:
+            parser.error(f'unknown scenario {name!r}')
+
+    # keep benchmark games out of the player's saved scores
+    storage.store = storage.Store(os.path.join(tempfile.mkdtemp(), 'store.json'))
+
+    start = time.perf_counter()
+    pygame.init()
+    pygame.display.set_mode(DISPLAY_SIZE)
+    startup = time.perf_counter() - start
+
+    results = {
+        'display_size': DISPLAY_SIZE,
+        'pygame_init_ms': startup * 1000,
+        'scenarios': {},
+    }
+
+    if args.cadence:
+        results['cadence'] = {}
+
+        for mode, background_work in (('idle', False), ('loaded', True)):
+            display = pygame.display.set_mode(DISPLAY_SIZE)
+            results['cadence'][mode] = cadence(display, args.cadence, background_work)
+
+        print(json.dumps(results, indent=2))
+
+        return 1 if results['cadence']['loaded']['late_ratio'] > CADENCE_MAX_LATE else 0
+
+    for name in args.scenarios or SCENARIOS:
+        display = pygame.display.set_mode(DISPLAY_SIZE)
+        results['scenarios'][name] = measure(SCENARIOS[name](), display, args.frames, args.warmup)
+
+    report = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(report)
+
+    else:
+        print(report)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+
+        for regression in regressions:
+            print('regression:', regression, file=sys.stderr)
+
+        if regressions:
+            return 1
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
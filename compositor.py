@@ -0,0 +1,241 @@
+import os
+import math
+import pygame
+
+try:
+    from pygame._sdl2 import video
+except ImportError:
+    video = None
+
+SCALE_QUALITY = {'integer': '0', 'nearest': '0', 'linear': '1'}
+
+class Compositor:
+    def __init__(self, display, bezel, phone_size=(300, 600), background_color=(255, 255, 255)):
+        self.display = display
+
+        self.phone_rect = pygame.Rect((0, 0), phone_size)
+        self.phone_rect.center = display.get_rect().center
+
+        self.background = pygame.Surface(display.get_size()).convert()
+        self.background.fill(background_color)
+        self.background.blit(bezel, (0, 0))
+
+        overlay_rect = self.phone_rect.clip(bezel.get_rect())
+        self.overlay = bezel.subsurface(overlay_rect).copy()
+        self.overlay_offset = (overlay_rect.x - self.phone_rect.x, overlay_rect.y - self.phone_rect.y)
+
+        self.hints = []
+        self.hints_rect = pygame.Rect(0, 0, 0, 0)
+        self.pending_rects = []
+
+        self.panel = None
+        self.panel_rect = pygame.Rect(0, 0, 0, 0)
+
+        self.app = None
+        self.full_redraw = True
+
+    def set_hints(self, utils_surfs):
+        old_rect = self.hints_rect
+
+        self.hints = []
+        for i, util_surf in enumerate(utils_surfs):
+            self.hints.append((util_surf, (10, 10 + i * (util_surf.get_height() + 10))))
+
+        self.hints_rect = pygame.Rect(0, 0, 0, 0)
+        if self.hints:
+            self.hints_rect = self.hints[0][0].get_rect(topleft=self.hints[0][1]).unionall(
+                [util_surf.get_rect(topleft=pos) for util_surf, pos in self.hints[1:]])
+
+        if self.hints_rect.colliderect(self.phone_rect) or old_rect.colliderect(self.phone_rect):
+            self.full_redraw = True
+            return
+
+        self.display.blit(self.background, old_rect, old_rect)
+        self.draw_hints()
+
+        self.pending_rects.extend((old_rect, self.hints_rect))
+
+    def set_panel(self, panel):
+        old_rect = self.panel_rect
+
+        self.panel = panel
+        self.panel_rect = pygame.Rect(0, 0, 0, 0)
+        if panel is not None:
+            self.panel_rect = panel.get_rect(topleft=(self.phone_rect.right + 20, self.phone_rect.top))
+
+        if self.panel_rect.colliderect(self.phone_rect) or old_rect.colliderect(self.phone_rect):
+            self.full_redraw = True
+            return
+
+        self.display.blit(self.background, old_rect, old_rect)
+        self.draw_panel()
+
+        self.pending_rects.extend((old_rect, self.panel_rect))
+
+    def draw_panel(self):
+        if self.panel is not None:
+            self.display.blit(self.panel, self.panel_rect)
+
+    def draw_hints(self):
+        for util_surf, pos in self.hints:
+            self.display.blit(util_surf, pos)
+
+    def draw_app(self, app, rect):
+        rect = rect.clip(app.screen.get_rect())
+        dest = rect.move(self.phone_rect.topleft)
+
+        self.display.blit(app.screen, dest, rect)
+        self.display.blit(self.overlay, dest, rect.move(-self.overlay_offset[0], -self.overlay_offset[1]))
+
+        return dest
+
+    def compose(self, app):
+        if app is not self.app:
+            self.app = app
+            app.mark_dirty()
+
+        if (self.full_redraw or self.hints_rect.colliderect(self.phone_rect)
+                or self.panel_rect.colliderect(self.phone_rect)):
+            self.display.blit(self.background, (0, 0))
+            self.draw_app(app, app.screen.get_rect())
+            self.draw_hints()
+            self.draw_panel()
+
+            self.full_redraw = False
+            self.pending_rects = []
+            app.dirty_rects.clear()
+
+            return None
+
+        rects = self.pending_rects
+        self.pending_rects = []
+
+        app_rects = app.dirty_rects if app.reports_dirty else [app.screen.get_rect()]
+        for rect in app_rects:
+            rects.append(self.draw_app(app, rect))
+
+        app.dirty_rects.clear()
+
+        return rects
+
+    @staticmethod
+    def flip(rects):
+        if rects is None:
+            pygame.display.flip()
+
+        elif rects:
+            pygame.display.update(rects)
+
+    def present(self, app):
+        self.flip(self.compose(app))
+
+class TextureCompositor:
+    def __init__(self, display, bezel, phone_size=(300, 600), background_color=(255, 255, 255), scaling='integer'):
+        self.display = display
+        self.background_color = background_color
+        self.scaling = scaling
+
+        self.window = video.Window.from_display_module()
+        self.renderer = video.Renderer.from_window(self.window)
+        self.renderer.logical_size = (0, 0)
+
+        self.scene_rect = display.get_rect()
+
+        self.phone_rect = pygame.Rect((0, 0), phone_size)
+        self.phone_rect.center = self.scene_rect.center
+
+        # SDL picks the filter when a texture is created
+        os.environ['SDL_RENDER_SCALE_QUALITY'] = SCALE_QUALITY[scaling]
+
+        background = pygame.Surface(display.get_size())
+        background.fill(background_color)
+        background.blit(bezel, (0, 0))
+        self.background = video.Texture.from_surface(self.renderer, background)
+
+        self.overlay_rect = self.phone_rect.clip(bezel.get_rect())
+        self.overlay = video.Texture.from_surface(self.renderer, bezel.subsurface(self.overlay_rect).copy())
+
+        self.app_texture = video.Texture(self.renderer, phone_size, streaming=True)
+
+        self.hints = []
+        self.panel = None
+        self.panel_pos = (0, 0)
+
+        self.app = None
+        self.changed = True
+        self.fit()
+
+    def fit(self):
+        window_width, window_height = self.window.size
+
+        scale = min(window_width / self.scene_rect.width, window_height / self.scene_rect.height)
+        if self.scaling == 'integer' and scale >= 1:
+            scale = math.floor(scale)
+
+        viewport = self.scene_rect.copy()
+        viewport.center = (window_width / scale / 2, window_height / scale / 2)
+
+        self.renderer.scale = (scale, scale)
+        self.renderer.set_viewport(viewport)
+
+    def set_hints(self, utils_surfs):
+        self.hints = []
+        for i, util_surf in enumerate(utils_surfs):
+            self.hints.append((video.Texture.from_surface(self.renderer, util_surf),
+                               (10, 10 + i * (util_surf.get_height() + 10))))
+
+        self.changed = True
+
+    def set_panel(self, panel):
+        self.panel = None
+        if panel is not None:
+            self.panel = video.Texture.from_surface(self.renderer, panel)
+            self.panel_pos = (self.phone_rect.right + 20, self.phone_rect.top)
+
+        self.changed = True
+
+    def upload_app(self, app, rect):
+        rect = rect.clip(app.screen.get_rect())
+        if rect:
+            self.app_texture.update(app.screen.subsurface(rect), rect)
+
+    def compose(self, app):
+        if app is not self.app:
+            self.app = app
+            app.mark_dirty()
+
+        app_rects = app.dirty_rects if app.reports_dirty else [app.screen.get_rect()]
+        for rect in app_rects:
+            self.upload_app(app, rect)
+
+        if app_rects:
+            self.changed = True
+
+        app.dirty_rects.clear()
+
+        if not self.changed:
+            return []
+
+        self.changed = False
+
+        self.renderer.draw_color = pygame.Color(self.background_color)
+        self.renderer.clear()
+
+        self.background.draw(dstrect=self.scene_rect)
+        self.app_texture.draw(dstrect=self.phone_rect)
+        self.overlay.draw(dstrect=self.overlay_rect)
+
+        for hint, pos in self.hints:
+            hint.draw(dstrect=pos)
+
+        if self.panel is not None:
+            self.panel.draw(dstrect=self.panel_pos)
+
+        return None
+
+    def flip(self, rects):
+        if rects is None:
+            self.renderer.present()
+
+    def present(self, app):
+        self.flip(self.compose(app))
@@ -0,0 +1,41 @@
+import pygame
+
+from collections import OrderedDict
+
+MAX_TEXT_SURFACES = 256
+
+fonts = {}
+text_surfaces = OrderedDict()
+
+def get_font(name=None, size=16, bold=False, italic=False):
+    key = (name, size, bold, italic)
+
+    font = fonts.get(key)
+    if font is None:
+        if name is None:
+            font = pygame.font.Font(None, size)
+            font.set_bold(bold)
+            font.set_italic(italic)
+
+        else:
+            font = pygame.font.SysFont(name, size, bold, italic)
+
+        fonts[key] = font
+
+    return font
+
+def render_text(font, text, color, antialias=True):
+    key = (font, text, tuple(color), antialias)
+
+    surface = text_surfaces.get(key)
+    if surface is not None:
+        text_surfaces.move_to_end(key)
+        return surface
+
+    surface = font.render(text, antialias, color)
+
+    text_surfaces[key] = surface
+    if len(text_surfaces) > MAX_TEXT_SURFACES:
+        text_surfaces.popitem(last=False)
+
+    return surface
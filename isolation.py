@@ -0,0 +1,294 @@
+import os
+import random
+import asyncio
+import weakref
+import multiprocessing
+import pygame
+
+from multiprocessing import shared_memory
+
+from base_app import BaseApp
+from replay import encode_event, decode_event
+import background
+import registry
+import storage
+
+WORKER_IDLE_TIMEOUT = 1.0
+WORKER_JOIN_TIMEOUT = 1.0
+
+context = multiprocessing.get_context('spawn')
+
+def frame_surface(buffer, size):
+    # same channel layout as a 32-bit display surface, with the unused alpha byte ignored on blits
+    surface = pygame.image.frombuffer(buffer, size, 'BGRA')
+    surface.set_alpha(None)
+
+    return surface
+
+class MirroredStore(storage.Store):
+    def __init__(self, data, conn):
+        super().__init__(os.devnull)
+        self.data = data
+        self.conn = conn
+
+    def schedule(self):
+        pass
+
+    def mirror(self, app_id):
+        self.conn.send(('store', app_id, self.data['apps'][app_id]))
+
+    def set(self, app_id, key, value):
+        super().set(app_id, key, value)
+        self.mirror(app_id)
+
+    def submit_score(self, app_id, score, name=None, board='default', size=storage.LEADERBOARD_SIZE):
+        rank = super().submit_score(app_id, score, name, board, size)
+        self.mirror(app_id)
+
+        return rank
+
+def serve(conn, app_path, shm_name, display_size, store_data, target_fps, seed):
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+    from phone import FrameScheduler
+
+    random.seed(seed)
+    pygame.init()
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    display = pygame.display.set_mode(display_size)
+
+    storage.store = MirroredStore(store_data, conn)
+    shm = shared_memory.SharedMemory(name=shm_name)
+
+    app = registry.AppEntry.from_manifest(app_path)(lambda app_name: conn.send(('switch', app_name)), {})
+
+    screen = frame_surface(shm.buf, app.screen_size)
+    screen.blit(app.screen, (0, 0))
+    app.surfaces.release(app.screen)
+    app.screen = screen
+    app.mark_dirty()
+
+    scheduler = FrameScheduler(target_fps)
+
+    # the buffer belongs to whoever last received it: we hand it over with every frame and get it back on 'ack'
+    # once the shell has copied the dirty rects out of it
+    owned = True
+    suspended = False
+    state = None
+    timeout = 0
+
+    try:
+        while True:
+            if suspended:
+                timeout = None
+
+            waited = timeout
+
+            while conn.poll(timeout):
+                timeout = 0
+                message = conn.recv()
+                kind = message[0]
+
+                if kind == 'input':
+                    app.mouse = message[1]
+                    for data in message[2]:
+                        app.events(decode_event(data))
+
+                    conn.send(('input_read',))
+
+                elif kind == 'ack':
+                    owned = True
+
+                elif kind == 'suspend':
+                    app.on_suspend()
+                    suspended = True
+
+                elif kind == 'resume':
+                    app.on_resume()
+                    scheduler.resume()
+                    suspended = False
+
+                elif kind == 'quit':
+                    return
+
+            if suspended:
+                continue
+
+            if waited:
+                scheduler.resume()
+
+            delta, steps, interpolation = scheduler.tick(loop.run_until_complete(scheduler.wait()))
+
+            for _ in range(steps):
+                app.update(scheduler.step)
+
+            app.delta = delta
+            app.interpolation = interpolation
+
+            rects = []
+            if owned:
+                app.run(display)
+
+                rects = [tuple(rect) for rect in (app.dirty_rects if app.reports_dirty else [app.screen.get_rect()])]
+                app.dirty_rects.clear()
+
+                if rects:
+                    conn.send(('frame', rects))
+                    owned = False
+
+            idle = app.is_idle()
+            if (app.keys_utilities, app.pointer_captured, idle, app.scope, app.surface_bytes()) != state:
+                state = (app.keys_utilities, app.pointer_captured, idle, app.scope, app.surface_bytes())
+                conn.send(('state', *state))
+
+            timeout = WORKER_IDLE_TIMEOUT if idle and not rects and not background.busy() else 0
+
+    except (EOFError, BrokenPipeError):
+        pass
+
+def shutdown(process, conn, shm):
+    try:
+        conn.send(('quit',))
+
+    except OSError:
+        pass
+
+    process.join(WORKER_JOIN_TIMEOUT)
+    if process.is_alive():
+        process.terminate()
+
+    conn.close()
+    shm.unlink()
+
+    try:
+        shm.close()
+
+    except BufferError:
+        pass
+
+class RemoteApp(BaseApp):
+    reports_dirty = True
+
+    def __init__(self, set_active_app, entry, display_size, target_fps):
+        super().__init__(set_active_app, keys_utilities=[])
+        self.entry = entry
+        self.display_size = display_size
+        self.target_fps = target_fps
+
+        self.shm = shared_memory.SharedMemory(create=True, size=self.screen_size[0] * self.screen_size[1] * 4)
+
+        # the worker draws into the shared frame; compose and full redraws only ever read our copy in screen
+        self.frame = frame_surface(self.shm.buf, self.screen_size)
+
+        self.process = None
+        self.conn = None
+        self.finalizer = None
+
+        self.start()
+
+    def start(self):
+        if self.finalizer is not None:
+            self.finalizer.detach()
+            self.process.terminate()
+            self.conn.close()
+
+        self.conn, worker_conn = context.Pipe()
+        self.process = context.Process(target=serve, name=f'app-{self.entry.name}', daemon=True,
+                                       args=(worker_conn, self.entry.path, self.shm.name, self.display_size,
+                                             storage.get_store().snapshot(), self.target_fps,
+                                             random.getrandbits(32)))
+        self.process.start()
+        worker_conn.close()
+
+        self.finalizer = weakref.finalize(self, shutdown, self.process, self.conn, self.shm)
+
+        self.pending_events = []
+        self.sent_mouse = None
+        self.input_in_flight = False
+        self.idle = False
+        self.worker_surface_bytes = 0
+        self.crashed = False
+
+    def send(self, message):
+        try:
+            self.conn.send(message)
+
+        except OSError:
+            self.crashed = True
+
+    def events(self, event):
+        data = encode_event(event)
+
+        # while the worker lags, back-to-back motion merges into one event so the backlog stays small
+        if event.type == pygame.MOUSEMOTION and self.pending_events and self.pending_events[-1][0] == pygame.MOUSEMOTION:
+            last = self.pending_events[-1][1]
+            data[1]['rel'] = [a + b for a, b in zip(last.get('rel', (0, 0)), data[1].get('rel', (0, 0)))]
+            self.pending_events[-1] = data
+            return
+
+        self.pending_events.append(data)
+
+    def run(self, display):
+        # one input message at a time: a stuck worker must not fill the pipe and block the shell in send()
+        if not self.input_in_flight and (self.pending_events or self.mouse != self.sent_mouse):
+            self.input_in_flight = True
+            self.send(('input', self.mouse, self.pending_events))
+            self.pending_events = []
+            self.sent_mouse = self.mouse
+
+        try:
+            while not self.crashed and self.conn.poll():
+                self.receive(self.conn.recv())
+
+        except (EOFError, OSError):
+            self.crashed = True
+
+        if self.crashed:
+            self.set_active_app('home')
+
+    def receive(self, message):
+        kind = message[0]
+
+        if kind == 'input_read':
+            self.input_in_flight = False
+
+        elif kind == 'frame':
+            for rect in message[1]:
+                self.screen.blit(self.frame, rect, rect)
+
+            self.send(('ack',))
+            self.mark_dirty(*message[1])
+
+        elif kind == 'state':
+            self.keys_utilities, self.pointer_captured, self.idle, self.scope, self.worker_surface_bytes = message[1:]
+
+        elif kind == 'switch':
+            self.set_active_app(message[1])
+
+        elif kind == 'store':
+            storage.get_store().set_app(message[1], message[2])
+
+    def on_suspend(self):
+        self.send(('suspend',))
+
+    def on_resume(self):
+        if self.crashed or not self.process.is_alive():
+            self.start()
+
+        else:
+            self.send(('resume',))
+
+        super().on_resume()
+
+    def is_idle(self):
+        return self.idle and not self.pending_events
+
+    def surface_bytes(self):
+        return self.worker_surface_bytes + super().surface_bytes()
+
+    def close(self):
+        self.finalizer()
+        super().close()
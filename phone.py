@@ -1,143 +1,615 @@
-import pygame
-
-from base_app import BaseApp
-import pong_master
-
-pygame.init()
-
-class Home(BaseApp):
-    def __init__(self, set_active_app, phone_apps):
-        super().__init__(set_active_app, keys_utilities=[{'text': 'Click on any app icon to open it', 'key': 'Click'}])
-        self.phone_apps = phone_apps
-        self.apps_rect = []
-        
-        for i, app_name in enumerate(list(self.phone_apps.keys())[1:]):
-            x = 12 + 96 * (i % 3)
-            y = 12 + 116 * (i // 3)
-            app_rect = pygame.Rect(x, y, 84, 84)
-            self.apps_rect.append((app_name, app_rect))
-
-        self.homescreen = pygame.image.load(r'phone\homescreen.png')
-
-    def run(self, display):
-        self.get_relative_mouse_pos(display)
-
-        self.screen.fill((255, 255, 255))
-        self.screen.blit(self.homescreen, (0, 0))
-
-        font = pygame.font.Font(None, 16)
-
-        for app_name, app_rect in self.apps_rect:
-            if hasattr(self.phone_apps[app_name], 'icon'):
-                    icon = self.phone_apps[app_name].icon.convert_alpha()
-
-                    mask = pygame.Surface(icon.get_size(), pygame.SRCALPHA)
-                    pygame.draw.rect(mask, (255, 255, 255), mask.get_rect(), border_radius=20)
-
-                    icon = icon.copy()
-                    icon.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
-
-                    self.screen.blit(icon, (app_rect.x, app_rect.y))
-
-            else:
-                pygame.draw.rect(self.screen, (200, 200, 200), app_rect, border_radius=20)
-                
-            text_surface = font.render(app_name, True, (0, 0, 0))
-            self.screen.blit(text_surface, (app_rect.x + app_rect.width // 2 - text_surface.get_width() // 2,
-                                                app_rect.y + app_rect.height + 4))
-        
-    def events(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            for app_name, app_rect in self.apps_rect:
-                if app_rect.collidepoint(self.mouse):
-                    self.set_active_app(app_name)
-
-                    break
-
-screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-
-phone_scene = pygame.image.load(r'phone\phone.png')
-phone_scene.set_colorkey((255, 0, 0))
-
-def set_active_app(app_name):
-    global app
-    app = phone_apps[app_name](set_active_app, phone_apps)
-
-phone_apps = {
-    'home': Home,
-    'pong master': pong_master.PongMaster,
-}
-
-app = phone_apps['home'](set_active_app, phone_apps)
-
-keys_utilities = []
-utils_surfs = []
-
-running = True
-def render_utilities(app, utils_surfs):
-    font = pygame.font.Font(None, 36)
-    key_font = pygame.font.Font(None, 36)
-    key_font.set_italic(True)
-
-    for util in app.keys_utilities:
-        text = util["text"]
-        key_word = util["key"]
-
-        parts = text.split(key_word, 1)
-        before = parts[0]
-        after = parts[1] if len(parts) > 1 else ""
-
-        before_surf = font.render(before, True, (255, 255, 255))
-        key_surf = key_font.render(key_word, True, (255, 255, 255))
-        after_surf = font.render(after, True, (255, 255, 255))
-
-        padding = 6
-        key_bg_rect = pygame.Rect(0, 0,
-                                    key_surf.get_width() + padding * 2,
-                                    key_surf.get_height() + padding * 2)
-
-        util_width = before_surf.get_width() + key_bg_rect.width + after_surf.get_width()
-        util_height = key_bg_rect.height + padding * 2
-        util_surf = pygame.Surface((util_width, util_height), pygame.SRCALPHA)
-
-        util_surf.blit(before_surf, (0, padding))
-        offset_x = before_surf.get_width()
-
-        key_bg_rect.topleft = (offset_x, 0)
-        pygame.draw.rect(util_surf, (128, 128, 128, 128), key_bg_rect, 0, 20)
-        util_surf.blit(key_surf, (offset_x + padding, padding))
-        offset_x += key_bg_rect.width
-
-        util_surf.blit(after_surf, (offset_x, padding))
-
-        utils_surfs.append(util_surf)
-
-while running:
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-
-        app.events(event)
-
-    screen.fill((255, 255, 255))
-
-    app.run(screen)
-    screen.blit(app.screen,
-             (screen.get_width() // 2 - app.screen.get_width() // 2,
-              screen.get_height() // 2 - app.screen.get_height() // 2))
-
-    screen.blit(phone_scene, (0, 0))
-
-    if app.keys_utilities == keys_utilities:
-        for i, util_surf in enumerate(utils_surfs):
-            screen.blit(util_surf, (10, 10 + i * (util_surf.get_height() + 10)))
-
-    else:
-        keys_utilities = app.keys_utilities
-        utils_surfs.clear()
-
-        render_utilities(app, utils_surfs)
-
-    pygame.display.flip()
-
-pygame.quit()
\ No newline at end of file
+import os
+import math
+import time
+import random
+import asyncio
+import collections
+import argparse
+import pygame
+
+from base_app import BaseApp
+from compositor import Compositor, TextureCompositor
+from profiler import Profiler
+from replay import Recorder
+from app_pool import AppPool
+from isolation import RemoteApp
+from widgets import KeyHint
+import assets
+import background
+import fonts
+import registry
+import storage
+
+pygame.init()
+
+TARGET_FPS = 60
+SIMULATION_RATE = 120
+MAX_STEPS_PER_FRAME = 8
+
+HOME_KEY = pygame.K_F1
+PROFILER_KEY = pygame.K_F3
+TRACE_KEY = pygame.K_F4
+TRACE_PATH = 'phone_trace.json'
+OVERLAY_INTERVAL = 15
+IDLE_TIMEOUT_MS = 1000
+
+APP_POOL_BUDGET = 32 * 1024 * 1024
+APP_SURFACE_BUDGET = 16 * 1024 * 1024
+
+SHELL_EVENTS = {pygame.QUIT, pygame.KEYDOWN}
+
+HOME_COLUMNS = 3
+HOME_MARGIN = 12
+HOME_CELL = (96, 116)
+HOME_ICON_SIZE = 84
+HOME_PREFETCH_ROWS = 2
+HOME_ICON_LOADS = 2
+HOME_TAP_SLOP = 8
+HOME_FLING_WINDOW = 0.1
+HOME_FRICTION = 3.0
+HOME_MIN_VELOCITY = 20.0
+HOME_WHEEL_VELOCITY = 900.0
+
+# the size phone.png is drawn for; the texture backend scales it to the display
+SCENE_SIZE = (1366, 768)
+
+class FrameScheduler:
+    def __init__(self, target_fps=TARGET_FPS, simulation_rate=SIMULATION_RATE, max_steps=MAX_STEPS_PER_FRAME):
+        self.clock = pygame.time.Clock()
+        self.target_fps = target_fps
+        self.step = 1 / simulation_rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+
+        self.frame_start = self.deadline = time.perf_counter()
+
+    def resume(self):
+        self.clock.tick()
+        self.accumulator = 0.0
+
+        self.frame_start = self.deadline = time.perf_counter()
+
+    async def wait(self):
+        # sleeps out the rest of the frame on the event loop, so background coroutines and job results run in the slack
+        now = time.perf_counter()
+
+        if self.target_fps:
+            self.deadline = max(self.deadline + 1 / self.target_fps, now)
+            await asyncio.sleep(self.deadline - now)
+
+        else:
+            await asyncio.sleep(0)
+
+        now = time.perf_counter()
+        delta, self.frame_start = now - self.frame_start, now
+
+        return delta
+
+    def tick(self, delta=None):
+        if delta is None:
+            delta = self.clock.tick(self.target_fps) / 1000
+
+        self.accumulator = min(self.accumulator + delta, self.step * self.max_steps)
+
+        steps = int(self.accumulator / self.step)
+        self.accumulator -= steps * self.step
+
+        return delta, steps, self.accumulator / self.step
+
+class Home(BaseApp):
+    reports_dirty = True
+    event_routes = {None: {pygame.MOUSEBUTTONDOWN: 'on_press',
+                           pygame.MOUSEBUTTONUP: 'on_release',
+                           pygame.MOUSEWHEEL: 'on_wheel',
+                           (pygame.KEYDOWN, pygame.K_PAGEUP): 'on_page_up',
+                           (pygame.KEYDOWN, pygame.K_PAGEDOWN): 'on_page_down'}}
+
+    def __init__(self, set_active_app, phone_apps):
+        super().__init__(set_active_app, keys_utilities=[{'text': 'Click on any app icon to open it', 'key': 'Click'},
+                                                         {'text': 'Drag or use the wheel to scroll', 'key': 'Drag'}])
+        self.phone_apps = phone_apps
+        self.app_names = []
+
+        self.homescreen = assets.load_image(assets.asset_path('homescreen.png'), alpha=False)
+        self.font = fonts.get_font(None, 16)
+
+        self.tiles = {}
+        self.unloaded = set()
+
+        self.scroll = 0.0
+        self.max_scroll = 0.0
+        self.velocity = 0.0
+        self.rendered_scroll = None
+
+        self.time = 0.0
+        self.dragging = False
+        self.drag_y = 0
+        self.drag_scroll = 0.0
+        self.drag_travel = 0
+        self.drag_samples = collections.deque()
+
+        self.refresh()
+
+    def refresh(self):
+        app_names = list(self.phone_apps.keys())[1:]
+        if app_names != self.app_names:
+            self.app_names = app_names
+            self.tiles.clear()
+            self.unloaded.clear()
+
+        rows = -(-len(self.app_names) // HOME_COLUMNS)
+        self.max_scroll = max(0.0, float(HOME_MARGIN + rows * HOME_CELL[1] - self.screen_size[1]))
+        self.set_scroll(self.scroll)
+
+        self.rendered_scroll = None
+
+    def on_resume(self):
+        self.refresh()
+        super().on_resume()
+
+    @staticmethod
+    def mask_icon(icon):
+        icon = icon.convert_alpha()
+        icon.blit(assets.rounded_mask(icon.get_size(), 20), (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
+
+        return icon
+
+    def load_icon(self, app_name):
+        icon = self.phone_apps[app_name].load_icon()
+        if icon is not None:
+            icon = self.mask_icon(icon)
+
+        return icon
+
+    def visible_rows(self, margin=0):
+        first = int((self.scroll - HOME_MARGIN) // HOME_CELL[1]) - margin
+        last = int((self.scroll + self.screen_size[1]) // HOME_CELL[1]) + margin
+
+        return range(max(first, 0), last + 1)
+
+    def update_tiles(self):
+        rows = self.visible_rows(HOME_PREFETCH_ROWS)
+        start = rows.start * HOME_COLUMNS
+        stop = min(rows.stop * HOME_COLUMNS, len(self.app_names))
+
+        for index in list(self.tiles):
+            if not start <= index < stop:
+                del self.tiles[index]
+                self.unloaded.discard(index)
+
+        for index in range(start, stop):
+            if index not in self.tiles:
+                app_name = self.app_names[index]
+                self.tiles[index] = (None, fonts.render_text(self.font, app_name, (0, 0, 0)))
+
+                if getattr(self.phone_apps[app_name], 'icon_path', None) is not None:
+                    self.unloaded.add(index)
+
+        # decoding is spread over frames so a fling never waits on a page of icons; visible tiles go first
+        visible = self.visible_rows()
+        order = sorted(self.unloaded, key=lambda index: (index // HOME_COLUMNS not in visible, index))
+
+        for index in order[:HOME_ICON_LOADS]:
+            self.unloaded.discard(index)
+            self.tiles[index] = (self.load_icon(self.app_names[index]), self.tiles[index][1])
+
+    def cell_rect(self, index):
+        return pygame.Rect(HOME_MARGIN + HOME_CELL[0] * (index % HOME_COLUMNS),
+                           HOME_MARGIN + HOME_CELL[1] * (index // HOME_COLUMNS) - int(self.scroll),
+                           HOME_ICON_SIZE, HOME_ICON_SIZE)
+
+    def app_at(self, pos):
+        x = pos[0] - HOME_MARGIN
+        y = pos[1] + int(self.scroll) - HOME_MARGIN
+
+        if x < 0 or y < 0 or not 0 <= pos[1] < self.screen_size[1]:
+            return None
+
+        column, row = x // HOME_CELL[0], y // HOME_CELL[1]
+        if column >= HOME_COLUMNS or x % HOME_CELL[0] >= HOME_ICON_SIZE or y % HOME_CELL[1] >= HOME_ICON_SIZE:
+            return None
+
+        index = row * HOME_COLUMNS + column
+        return self.app_names[index] if index < len(self.app_names) else None
+
+    def set_scroll(self, scroll):
+        self.scroll = max(0.0, min(scroll, self.max_scroll))
+
+        if self.scroll in (0.0, self.max_scroll):
+            self.velocity = 0.0
+
+    def update(self, step):
+        self.time += step
+
+        if self.dragging:
+            self.drag_samples.append((self.time, self.mouse[1]))
+            while self.drag_samples[0][0] < self.time - HOME_FLING_WINDOW:
+                self.drag_samples.popleft()
+
+            self.drag_travel = max(self.drag_travel, abs(self.mouse[1] - self.drag_y))
+            self.set_scroll(self.drag_scroll + self.drag_y - self.mouse[1])
+
+        elif self.velocity:
+            self.set_scroll(self.scroll + self.velocity * step)
+            self.velocity *= math.exp(-HOME_FRICTION * step)
+
+            if abs(self.velocity) < HOME_MIN_VELOCITY:
+                self.velocity = 0.0
+
+    def run(self, display):
+        if self.scroll == self.rendered_scroll and not self.unloaded:
+            return
+
+        self.rendered_scroll = self.scroll
+        self.update_tiles()
+
+        self.screen.fill((255, 255, 255))
+        self.screen.blit(self.homescreen, (0, 0))
+
+        for row in self.visible_rows():
+            for index in range(row * HOME_COLUMNS, min((row + 1) * HOME_COLUMNS, len(self.app_names))):
+                icon, label = self.tiles[index]
+                rect = self.cell_rect(index)
+
+                if icon is not None:
+                    self.screen.blit(icon, rect)
+
+                else:
+                    pygame.draw.rect(self.screen, (200, 200, 200), rect, border_radius=20)
+
+                self.screen.blit(label, (rect.centerx - label.get_width() // 2, rect.bottom + 4))
+
+        self.mark_dirty()
+
+    def on_press(self, event):
+        if event.button != 1:
+            return
+
+        self.dragging = True
+        self.drag_y = self.mouse[1]
+        self.drag_scroll = self.scroll
+        self.drag_travel = 0
+        self.drag_samples.clear()
+        self.velocity = 0.0
+
+    def on_release(self, event):
+        if event.button != 1 or not self.dragging:
+            return
+
+        self.dragging = False
+
+        if self.drag_travel < HOME_TAP_SLOP:
+            app_name = self.app_at(self.mouse)
+            if app_name is not None:
+                self.set_active_app(app_name)
+
+            return
+
+        (start_time, start_y), (end_time, end_y) = self.drag_samples[0], self.drag_samples[-1]
+        if end_time > start_time:
+            self.velocity = (start_y - end_y) / (end_time - start_time)
+
+    def on_wheel(self, event):
+        self.velocity -= event.y * HOME_WHEEL_VELOCITY
+
+    def on_page_up(self, event):
+        self.set_scroll(self.scroll - (self.screen_size[1] - HOME_MARGIN))
+
+    def on_page_down(self, event):
+        self.set_scroll(self.scroll + (self.screen_size[1] - HOME_MARGIN))
+
+    def is_idle(self):
+        return not self.dragging and not self.velocity and not self.unloaded
+
+def coalesce_motion(events):
+    last = None
+    rel_x = rel_y = 0
+
+    for i, event in enumerate(events):
+        if event.type == pygame.MOUSEMOTION:
+            last = i
+            rel_x += event.rel[0]
+            rel_y += event.rel[1]
+
+    if last is None:
+        return events
+
+    motion = pygame.event.Event(pygame.MOUSEMOTION, {**events[last].dict, 'rel': (rel_x, rel_y)})
+
+    return [motion if i == last else event for i, event in enumerate(events)
+            if event.type != pygame.MOUSEMOTION or i == last]
+
+def allow_events(app):
+    event_types = app.event_types()
+
+    if event_types is None:
+        pygame.event.set_allowed(None)
+        return
+
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(list(SHELL_EVENTS | event_types))
+
+def build_hints(keys_utilities):
+    font = fonts.get_font(None, 36)
+    key_font = fonts.get_font(None, 36, italic=True)
+
+    return [KeyHint(util['text'], util['key'], font, key_font) for util in keys_utilities]
+
+class Phone:
+    def __init__(self, display, target_fps=TARGET_FPS, profile=False, trace_path=TRACE_PATH, seed=None, record_path=None,
+                 backend='surface', scaling='integer', isolate=False):
+        self.display = display
+        self.target_fps = target_fps
+        self.isolate = isolate
+
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        random.seed(self.seed)
+
+        self.recorder = None
+        if record_path is not None:
+            self.recorder = Recorder(record_path, self.seed, display.get_size(), storage.get_store().snapshot())
+
+        phone_scene = assets.load_image(assets.asset_path('phone.png'), alpha=False, colorkey=(255, 0, 0))
+
+        if backend == 'texture':
+            self.compositor = TextureCompositor(display, phone_scene, scaling=scaling)
+
+        else:
+            self.compositor = Compositor(display, phone_scene)
+
+        self.scheduler = FrameScheduler(target_fps)
+        self.profiler = Profiler(profile, budget_ms=1000 / target_fps if target_fps else 1000 / TARGET_FPS)
+        self.trace_path = trace_path
+
+        self.phone_apps = {'home': Home}
+        self.phone_apps.update(registry.discover())
+
+        self.app_pool = AppPool(APP_POOL_BUDGET)
+
+        self.app = None
+        self.active_app_name = None
+        self.set_active_app('home')
+
+        self.keys_utilities = []
+        self.hint_sets = {}
+
+        self.pointer_captured = False
+        self.pointer = (0, 0)
+
+        self.idle = False
+        self.resumed = False
+        self.running = True
+
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def set_active_app(self, app_name):
+        if app_name == self.active_app_name:
+            return
+
+        if self.app is not None:
+            self.app_pool.suspend(self.active_app_name, self.app)
+
+        app = self.app_pool.resume(app_name)
+        if app is None:
+            app = self.launch(app_name)
+
+        self.app = app
+        self.active_app_name = app_name
+
+        allow_events(app)
+
+    def launch(self, app_name):
+        if self.isolate and app_name != 'home':
+            return RemoteApp(self.set_active_app, self.phone_apps[app_name], self.display.get_size(),
+                             self.target_fps or TARGET_FPS)
+
+        return self.phone_apps[app_name](self.set_active_app, self.phone_apps)
+
+    def set_hints(self, app_name, app):
+        key = (app_name, app.scope)
+
+        hint_set = self.hint_sets.get(key)
+        if hint_set is None or hint_set[0] != app.keys_utilities:
+            hint_set = self.hint_sets[key] = (app.keys_utilities, build_hints(app.keys_utilities))
+
+        self.compositor.set_hints([hint.get_surface() for hint in hint_set[1]])
+
+    def close_app(self, app_name):
+        if app_name == self.active_app_name:
+            self.set_active_app('home')
+
+        self.app_pool.discard(app_name)
+
+    def set_pointer_capture(self, captured):
+        self.pointer_captured = captured
+
+        # a hidden cursor plus an input grab puts SDL in relative mouse mode
+        pygame.event.set_grab(captured)
+        pygame.mouse.set_visible(not captured)
+
+        if captured:
+            self.pointer = self.clamp_pointer(pygame.mouse.get_pos())
+            pygame.mouse.get_rel()
+
+        else:
+            pygame.mouse.set_pos(self.pointer)
+
+    def clamp_pointer(self, pos):
+        phone_rect = self.compositor.phone_rect
+
+        return (max(phone_rect.left, min(pos[0], phone_rect.right - 1)),
+                max(phone_rect.top, min(pos[1], phone_rect.bottom - 1)))
+
+    def read_pointer(self):
+        if not self.pointer_captured:
+            return pygame.mouse.get_pos()
+
+        rel = pygame.mouse.get_rel()
+        self.pointer = self.clamp_pointer((self.pointer[0] + rel[0], self.pointer[1] + rel[1]))
+
+        return self.pointer
+
+    def to_phone(self, pos):
+        return pos[0] - self.compositor.phone_rect.x, pos[1] - self.compositor.phone_rect.y
+
+    def toggle_profiler(self):
+        self.profiler.toggle()
+
+        if not self.profiler.enabled:
+            self.compositor.set_panel(None)
+
+    def frame(self, events, delta=None, mouse_pos=None):
+        profiler = self.profiler
+        profiler.begin_frame(self.app)
+
+        if mouse_pos is None:
+            mouse_pos = self.read_pointer()
+
+        self.app.mouse = self.to_phone(mouse_pos)
+
+        with profiler.section('events'):
+            for event in events:
+                if event.type == pygame.QUIT:
+                    self.running = False
+
+                elif event.type == pygame.KEYDOWN and event.key == HOME_KEY:
+                    self.set_active_app('home')
+                    continue
+
+                elif event.type == pygame.KEYDOWN and event.key == PROFILER_KEY:
+                    self.toggle_profiler()
+                    continue
+
+                elif event.type == pygame.KEYDOWN and event.key == TRACE_KEY:
+                    self.profiler.export_chrome_trace(self.trace_path)
+                    continue
+
+                self.app.events(event)
+
+        app = self.app
+        app_name = self.active_app_name
+
+        if app.pointer_captured != self.pointer_captured:
+            self.set_pointer_capture(app.pointer_captured)
+
+        if self.pointer_captured:
+            mouse_pos = self.clamp_pointer(mouse_pos)
+
+        app.mouse = self.to_phone(mouse_pos)
+
+        # serve() sleeps out the frame itself and times that as the wait
+        with profiler.section('wait') if delta is None else profiler.null_section:
+            delta, steps, interpolation = self.scheduler.tick(delta)
+
+        with profiler.section('update'):
+            for _ in range(steps):
+                app.update(self.scheduler.step)
+
+        app.delta = delta
+        app.interpolation = interpolation
+
+        with profiler.section('run'):
+            app.run(self.display)
+
+        with profiler.section('utilities'):
+            if app.keys_utilities is not self.keys_utilities:
+                self.keys_utilities = app.keys_utilities
+                self.set_hints(app_name, app)
+
+        with profiler.section('compose'):
+            rects = self.compositor.compose(app)
+
+        with profiler.section('flip'):
+            self.compositor.flip(rects)
+
+        self.idle = rects == [] and app.is_idle()
+
+        if app is self.app and self.active_app_name != 'home' and app.surface_bytes() > APP_SURFACE_BUDGET:
+            self.close_app(self.active_app_name)
+
+        profiler.end_frame()
+
+        if self.recorder is not None:
+            self.recorder.record(events, delta, mouse_pos, app, self.resumed)
+
+        self.resumed = False
+
+        if profiler.enabled and profiler.frame_count % OVERLAY_INTERVAL == 0:
+            self.compositor.set_panel(profiler.render_overlay())
+
+    def wait_for_events(self):
+        event = pygame.event.wait(IDLE_TIMEOUT_MS)
+        self.scheduler.resume()
+        self.resumed = True
+
+        events = [] if event.type == pygame.NOEVENT else [event]
+        events.extend(pygame.event.get())
+
+        return events
+
+    async def serve(self):
+        while self.running:
+            with self.profiler.section('wait'):
+                delta = await self.scheduler.wait()
+
+            events = pygame.event.get()
+            if not events and self.idle and not background.busy():
+                events = self.wait_for_events()
+
+            self.frame(coalesce_motion(events), delta)
+
+    def run(self):
+        try:
+            self.loop.run_until_complete(self.serve())
+
+        finally:
+            background.shutdown()
+
+            # let the cancelled coroutines unwind
+            self.loop.run_until_complete(asyncio.sleep(0))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Python Phone')
+    parser.add_argument('--fps', type=int, default=TARGET_FPS, help='target frame rate, 0 for uncapped')
+    parser.add_argument('--profile', action='store_true', help='start with the profiler overlay enabled')
+    parser.add_argument('--trace', metavar='PATH', help='write a Chrome trace of the session to PATH on exit')
+    parser.add_argument('--record', metavar='PATH', help='record input, frame timing and the RNG seed to PATH')
+    parser.add_argument('--seed', type=int, help='seed for the random module, random by default')
+    parser.add_argument('--backend', choices=('surface', 'texture'), default='surface',
+                        help='compose on the CPU or with SDL2 render textures scaled to the display')
+    parser.add_argument('--scaling', choices=('integer', 'nearest', 'linear'), default='integer',
+                        help='how the texture backend scales the phone to the display')
+    parser.add_argument('--software', action='store_true', help='use the SDL software renderer')
+    parser.add_argument('--isolate', action='store_true',
+                        help='run every app in its own worker process, rendering into shared memory')
+    args = parser.parse_args(argv)
+
+    if args.software:
+        os.environ['SDL_RENDER_DRIVER'] = 'software'
+
+    if args.backend == 'texture':
+        screen = pygame.display.set_mode(SCENE_SIZE, pygame.SCALED | pygame.FULLSCREEN)
+
+    else:
+        screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+
+    phone = Phone(screen, args.fps, profile=args.profile or args.trace is not None,
+                  trace_path=args.trace or TRACE_PATH, seed=args.seed, record_path=args.record,
+                  backend=args.backend, scaling=args.scaling, isolate=args.isolate)
+
+    # an app that raises is the session worth keeping, so the recording and trace are written either way
+    try:
+        phone.run()
+
+    finally:
+        if args.trace:
+            phone.profiler.export_chrome_trace(args.trace)
+
+        if phone.recorder is not None:
+            phone.recorder.save()
+
+        pygame.quit()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+import json
+import time
+import pygame
+
+from collections import deque
+
+import fonts
+
+STAGES = ('events', 'update', 'run', 'utilities', 'compose', 'flip', 'wait')
+
+class Section:
+    def __init__(self, profiler, stage):
+        self.profiler = profiler
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler.record(self.stage, self.start, time.perf_counter_ns())
+
+class NullSection:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+class Profiler:
+    def __init__(self, enabled=False, window=120, max_events=200000, budget_ms=1000 / 60):
+        self.enabled = enabled
+        self.window = window
+        self.budget_ms = budget_ms
+
+        self.stats = {}
+        self.trace_events = deque(maxlen=max_events)
+        self.null_section = NullSection()
+
+        self.frame_count = 0
+        self.frame_start = 0
+        self.frame_started = False
+        self.app_key = ('', None)
+        self.surface_bytes = 0
+
+        self.font = None
+
+    def toggle(self):
+        self.enabled = not self.enabled
+
+        # toggled mid-frame: nothing is recorded until the next begin_frame sets the start and the app
+        self.frame_started = False
+
+    def begin_frame(self, app):
+        if not self.enabled:
+            return
+
+        self.app_key = (type(app).__name__, getattr(app, 'scope', None))
+        self.surface_bytes = app.surface_bytes()
+        self.frame_start = time.perf_counter_ns()
+        self.frame_started = True
+
+    def end_frame(self):
+        if not self.enabled or not self.frame_started:
+            return
+
+        self.record('frame', self.frame_start, time.perf_counter_ns())
+        self.frame_count += 1
+
+    def section(self, stage):
+        if not self.enabled:
+            return self.null_section
+
+        return Section(self, stage)
+
+    def record(self, stage, start, end):
+        if not self.frame_started:
+            return
+
+        key = (*self.app_key, stage)
+
+        samples = self.stats.get(key)
+        if samples is None:
+            samples = self.stats[key] = deque(maxlen=self.window)
+
+        samples.append((end - start) / 1e6)
+
+        app_name, scope = self.app_key
+        self.trace_events.append({
+            'name': stage,
+            'cat': app_name,
+            'ph': 'X',
+            'ts': start / 1000,
+            'dur': (end - start) / 1000,
+            'pid': 1,
+            'tid': 0 if stage == 'frame' else 1,
+            'args': {'app': app_name, 'scope': scope},
+        })
+
+    def summary(self, app_key=None):
+        app_key = app_key or self.app_key
+
+        summary = {}
+        for stage in (*STAGES, 'frame'):
+            samples = self.stats.get((*app_key, stage))
+            if samples:
+                summary[stage] = (sum(samples) / len(samples), max(samples))
+
+        return summary
+
+    def render_overlay(self):
+        if self.font is None:
+            self.font = fonts.get_font(None, 22)
+
+        app_name, scope = self.app_key
+        lines = [(f'{app_name} [{scope}]' if scope is not None else app_name, (255, 255, 255))]
+
+        for stage, (average, peak) in self.summary().items():
+            color = (255, 90, 90) if peak > self.budget_ms else (255, 255, 255)
+            lines.append((f'{stage:<10} {average:6.2f} ms  max {peak:6.2f}', color))
+
+        lines.append((f'{"surfaces":<10} {self.surface_bytes / 2 ** 20:6.2f} MB', (255, 255, 255)))
+
+        line_height = self.font.get_linesize()
+        overlay = pygame.Surface((260, 12 + line_height * len(lines)), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 180))
+
+        for i, (text, color) in enumerate(lines):
+            overlay.blit(self.font.render(text, True, color), (8, 6 + i * line_height))
+
+        return overlay
+
+    def export_chrome_trace(self, path):
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': list(self.trace_events), 'displayTimeUnit': 'ms'}, f)
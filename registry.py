@@ -0,0 +1,94 @@
+import os
+import json
+import warnings
+import importlib
+import pygame
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+APPS_DIR = os.path.join(PACKAGE_DIR, 'apps')
+THUMBNAILS_DIR = os.path.join(PACKAGE_DIR, '.cache', 'thumbnails')
+
+ICON_SIZE = (84, 84)
+
+class AppEntry:
+    def __init__(self, name, path, entry, icon=None):
+        self.name = name
+        self.path = path
+        self.entry = entry
+        self.icon_path = os.path.join(path, icon) if icon is not None else None
+
+        self.app_class = None
+
+    @classmethod
+    def from_manifest(cls, path):
+        with open(os.path.join(path, 'manifest.json')) as f:
+            manifest = json.load(f)
+
+        if ':' not in manifest['entry']:
+            raise ValueError(f'entry {manifest["entry"]!r} is not module:class')
+
+        return cls(manifest['name'], path, manifest['entry'], manifest.get('icon'))
+
+    def load_icon(self):
+        # not kept on the entry: the home screen holds icons only for the tiles around its viewport
+        if self.icon_path is None:
+            return None
+
+        return load_thumbnail(self.icon_path)
+
+    def load(self):
+        if self.app_class is None:
+            module_name, class_name = self.entry.split(':')
+            module = importlib.import_module(f'apps.{os.path.basename(self.path)}.{module_name}')
+
+            self.app_class = getattr(module, class_name)
+
+        return self.app_class
+
+    def __call__(self, *args, **kwargs):
+        return self.load()(*args, **kwargs)
+
+def load_thumbnail(icon_path, size=ICON_SIZE):
+    name = os.path.basename(os.path.dirname(icon_path))
+    thumbnail_path = os.path.join(THUMBNAILS_DIR, f'{name}-{size[0]}x{size[1]}.png')
+
+    try:
+        if os.path.getmtime(thumbnail_path) >= os.path.getmtime(icon_path):
+            return pygame.image.load(thumbnail_path)
+
+    except (OSError, pygame.error):
+        pass
+
+    icon = pygame.image.load(icon_path)
+    if icon.get_size() != size:
+        scale = pygame.transform.smoothscale if icon.get_bitsize() >= 24 else pygame.transform.scale
+        icon = scale(icon, size)
+
+    try:
+        os.makedirs(THUMBNAILS_DIR, exist_ok=True)
+        pygame.image.save(icon, thumbnail_path)
+
+    except (OSError, pygame.error):
+        pass
+
+    return icon
+
+def discover(apps_dir=APPS_DIR):
+    apps = {}
+
+    for folder in sorted(os.listdir(apps_dir)):
+        path = os.path.join(apps_dir, folder)
+        if not os.path.isfile(os.path.join(path, 'manifest.json')):
+            continue
+
+        # one broken community manifest shouldn't keep the phone from starting
+        try:
+            entry = AppEntry.from_manifest(path)
+
+        except (OSError, ValueError, KeyError, TypeError) as error:
+            warnings.warn(f'skipping {folder}: invalid manifest ({error!r})')
+            continue
+
+        apps[entry.name] = entry
+
+    return apps
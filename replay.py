@@ -0,0 +1,127 @@
+import os
+import sys
+import json
+import time
+import zlib
+import argparse
+import tempfile
+import pygame
+
+import storage
+
+RECORDING_VERSION = 1
+
+def encode_event(event):
+    attributes = {}
+
+    for key, value in event.dict.items():
+        if isinstance(value, tuple):
+            value = list(value)
+
+        if isinstance(value, (int, float, str, bool, list, type(None))):
+            attributes[key] = value
+
+    return [event.type, attributes]
+
+def decode_event(data):
+    event_type, attributes = data
+    return pygame.event.Event(event_type, {key: tuple(value) if isinstance(value, list) else value
+                                           for key, value in attributes.items()})
+
+def checksum(surface):
+    return zlib.crc32(pygame.image.tobytes(surface, 'RGB'))
+
+class Recorder:
+    def __init__(self, path, seed, display_size, store_snapshot):
+        self.path = path
+        self.recording = {
+            'version': RECORDING_VERSION,
+            'seed': seed,
+            'display_size': list(display_size),
+            'store': store_snapshot,
+            'frames': [],
+        }
+
+    def record(self, events, delta, mouse_pos, app, resumed=False):
+        self.recording['frames'].append({
+            'delta': delta,
+            'resumed': resumed,
+            'mouse': list(mouse_pos),
+            'events': [encode_event(event) for event in events],
+            'checksum': checksum(app.screen),
+        })
+
+    def save(self):
+        with open(self.path, 'w') as f:
+            json.dump(self.recording, f)
+
+def replay(recording, profile=False):
+    import phone
+
+    storage.store = storage.Store(os.path.join(tempfile.mkdtemp(), 'store.json'))
+    storage.store.data = recording['store']
+
+    display = pygame.display.set_mode(recording['display_size'])
+    shell = phone.Phone(display, target_fps=0, profile=profile, seed=recording['seed'])
+
+    mismatches = []
+    frame_times = []
+
+    for index, frame in enumerate(recording['frames']):
+        events = [decode_event(event) for event in frame['events']]
+
+        # the shell dropped its step accumulator after waiting for input before this frame
+        if frame.get('resumed'):
+            shell.scheduler.resume()
+
+        start = time.perf_counter()
+        shell.frame(events, frame['delta'], tuple(frame['mouse']))
+        frame_times.append((time.perf_counter() - start) * 1000)
+
+        if checksum(shell.app.screen) != frame['checksum']:
+            mismatches.append(index)
+
+    return shell, frame_times, mismatches
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Replay a recorded phone session headlessly and as fast as possible.')
+    parser.add_argument('recording')
+    parser.add_argument('--trace', metavar='PATH', help='write a Chrome trace of the replay to PATH')
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+    with open(args.recording) as f:
+        recording = json.load(f)
+
+    if recording.get('version') != RECORDING_VERSION:
+        parser.error(f'unsupported recording version {recording.get("version")!r}')
+
+    import benchmark
+
+    start = time.perf_counter()
+    shell, frame_times, mismatches = replay(recording, profile=args.trace is not None)
+    total = time.perf_counter() - start
+
+    if args.trace:
+        shell.profiler.export_chrome_trace(args.trace)
+
+    print(json.dumps({
+        'frames': len(frame_times),
+        'total_s': total,
+        'replay_fps': len(frame_times) / total if total else 0.0,
+        'frame_ms': {
+            'mean': sum(frame_times) / len(frame_times) if frame_times else 0.0,
+            'p50': benchmark.percentile(frame_times, 50) if frame_times else 0.0,
+            'p95': benchmark.percentile(frame_times, 95) if frame_times else 0.0,
+            'p99': benchmark.percentile(frame_times, 99) if frame_times else 0.0,
+        },
+        'mismatched_frames': len(mismatches),
+        'first_mismatch': mismatches[0] if mismatches else None,
+    }, indent=2))
+
+    return 1 if mismatches else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,95 @@
+import pygame
+
+class SpatialGrid:
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+
+        self.cells = {}
+        self.rects = {}
+        self.key_cells = {}
+
+    def __len__(self):
+        return len(self.rects)
+
+    def __contains__(self, key):
+        return key in self.rects
+
+    def cell_range(self, rect):
+        return (rect.left // self.cell_size, rect.top // self.cell_size,
+                (rect.right - 1) // self.cell_size, (rect.bottom - 1) // self.cell_size)
+
+    def iter_cells(self, cell_range):
+        left, top, right, bottom = cell_range
+
+        for x in range(left, right + 1):
+            for y in range(top, bottom + 1):
+                yield x, y
+
+    def insert(self, key, rect):
+        if key in self.rects:
+            self.remove(key)
+
+        rect = pygame.Rect(rect)
+        cell_range = self.cell_range(rect)
+
+        self.rects[key] = rect
+        self.key_cells[key] = cell_range
+
+        for cell in self.iter_cells(cell_range):
+            self.cells.setdefault(cell, set()).add(key)
+
+    def move(self, key, rect):
+        rect = pygame.Rect(rect)
+        cell_range = self.cell_range(rect)
+
+        if self.key_cells.get(key) != cell_range:
+            self.insert(key, rect)
+            return
+
+        self.rects[key] = rect
+
+    def remove(self, key):
+        self.rects.pop(key)
+
+        for cell in self.iter_cells(self.key_cells.pop(key)):
+            keys = self.cells[cell]
+            keys.discard(key)
+
+            if not keys:
+                del self.cells[cell]
+
+    def clear(self):
+        self.cells.clear()
+        self.rects.clear()
+        self.key_cells.clear()
+
+    def query_rect(self, rect):
+        rect = pygame.Rect(rect)
+        found = set()
+
+        for cell in self.iter_cells(self.cell_range(rect)):
+            for key in self.cells.get(cell, ()):
+                if key not in found and self.rects[key].colliderect(rect):
+                    found.add(key)
+
+        return found
+
+    def query_point(self, point):
+        keys = self.cells.get((int(point[0]) // self.cell_size, int(point[1]) // self.cell_size), ())
+
+        return [key for key in keys if self.rects[key].collidepoint(point)]
+
+    def pairs(self):
+        pairs = set()
+
+        for keys in self.cells.values():
+            if len(keys) < 2:
+                continue
+
+            keys = list(keys)
+            for i, a in enumerate(keys):
+                for b in keys[i + 1:]:
+                    if self.rects[a].colliderect(self.rects[b]):
+                        pairs.add((a, b) if id(a) < id(b) else (b, a))
+
+        return pairs
@@ -0,0 +1,179 @@
+import os
+import json
+import time
+import atexit
+import tempfile
+import threading
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+STORE_PATH = os.path.join(PACKAGE_DIR, 'saves', 'store.json')
+
+STORE_VERSION = 1
+LEADERBOARD_SIZE = 10
+
+class Namespace:
+    def __init__(self, store, app_id):
+        self.store = store
+        self.app_id = app_id
+
+    def get(self, key, default=None):
+        return self.store.get(self.app_id, key, default)
+
+    def set(self, key, value):
+        self.store.set(self.app_id, key, value)
+
+    def leaderboard(self, board='default'):
+        return self.get('leaderboards', {}).get(board, [])
+
+    def submit_score(self, score, name=None, board='default', size=LEADERBOARD_SIZE):
+        return self.store.submit_score(self.app_id, score, name, board, size)
+
+class Store:
+    def __init__(self, path=STORE_PATH, flush_delay=0.5):
+        self.path = path
+        self.flush_delay = flush_delay
+
+        self.data = self.load()
+
+        self.condition = threading.Condition()
+        self.dirty = False
+        self.writing = False
+        self.flush_requested = False
+        self.closed = False
+        self.thread = None
+
+    def load(self):
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+
+        except (FileNotFoundError, ValueError):
+            return {'version': STORE_VERSION, 'apps': {}}
+
+        if data.get('version') != STORE_VERSION:
+            raise ValueError(f'unsupported store version {data.get("version")!r} in {self.path}')
+
+        return data
+
+    def snapshot(self):
+        with self.condition:
+            return json.loads(json.dumps(self.data))
+
+    def namespace(self, app_id):
+        return Namespace(self, app_id)
+
+    def get(self, app_id, key, default=None):
+        with self.condition:
+            return self.data['apps'].get(app_id, {}).get(key, default)
+
+    def set(self, app_id, key, value):
+        with self.condition:
+            self.data['apps'].setdefault(app_id, {})[key] = value
+            self.schedule()
+
+    def set_app(self, app_id, values):
+        with self.condition:
+            self.data['apps'][app_id] = values
+            self.schedule()
+
+    def submit_score(self, app_id, score, name=None, board='default', size=LEADERBOARD_SIZE):
+        with self.condition:
+            boards = self.data['apps'].setdefault(app_id, {}).setdefault('leaderboards', {})
+            entries = boards.setdefault(board, [])
+
+            submitted = {'score': score, 'name': name}
+            entries.append(submitted)
+            entries.sort(key=lambda entry: entry['score'], reverse=True)
+            del entries[size:]
+
+            self.schedule()
+
+            return next((i for i, entry in enumerate(entries) if entry is submitted), None)
+
+    def schedule(self):
+        self.dirty = True
+
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.writer, name='store-writer', daemon=True)
+            self.thread.start()
+
+        self.condition.notify_all()
+
+    def writer(self):
+        while True:
+            with self.condition:
+                while not self.dirty and not self.closed:
+                    self.condition.wait()
+
+                if not self.dirty:
+                    return
+
+                deadline = time.monotonic() + self.flush_delay
+                while not self.closed and not self.flush_requested:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+
+                    self.condition.wait(remaining)
+
+                self.flush_requested = False
+
+                snapshot = json.dumps(self.data, indent=1)
+                self.dirty = False
+                self.writing = True
+
+            try:
+                self.write(snapshot)
+
+            except OSError:
+                with self.condition:
+                    self.dirty = self.dirty or not self.closed
+
+            finally:
+                with self.condition:
+                    self.writing = False
+                    self.condition.notify_all()
+
+    def write(self, snapshot):
+        directory = os.path.dirname(self.path)
+        os.makedirs(directory, exist_ok=True)
+
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.store-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(snapshot)
+                f.flush()
+                os.fsync(f.fileno())
+
+            os.replace(temp_path, self.path)
+
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def flush(self, timeout=None):
+        with self.condition:
+            self.flush_requested = self.dirty
+            self.condition.notify_all()
+
+            return self.condition.wait_for(lambda: not self.dirty and not self.writing, timeout)
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+        if self.thread is not None:
+            self.thread.join()
+
+store = None
+
+def get_store():
+    global store
+
+    if store is None:
+        store = Store()
+        atexit.register(store.close)
+
+    return store
@@ -0,0 +1,104 @@
+import pygame
+
+FREE_BUDGET = 8 * 1024 * 1024
+
+def surface_bytes(surface):
+    return surface.get_pitch() * surface.get_height()
+
+class SurfacePool:
+    def __init__(self, free_budget=FREE_BUDGET):
+        self.free_budget = free_budget
+
+        self.free = {}
+        self.free_bytes = 0
+        self.created = 0
+
+    @staticmethod
+    def key(size, flags):
+        return tuple(size), flags & pygame.SRCALPHA
+
+    def acquire(self, size, flags=0):
+        surfaces = self.free.get(self.key(size, flags))
+        if not surfaces:
+            self.created += 1
+            return pygame.Surface(size, flags)
+
+        surface = surfaces.pop()
+        self.free_bytes -= surface_bytes(surface)
+
+        return surface
+
+    def release(self, surface):
+        # recycled buffers come back without the last owner's clip, colorkey or surface alpha
+        surface.set_clip(None)
+        surface.set_colorkey(None)
+        surface.set_alpha(255 if surface.get_flags() & pygame.SRCALPHA else None)
+
+        self.free.setdefault(self.key(surface.get_size(), surface.get_flags()), []).append(surface)
+        self.free_bytes += surface_bytes(surface)
+
+        self.trim(self.free_budget)
+
+    def trim(self, budget=0):
+        for key in list(self.free):
+            surfaces = self.free[key]
+
+            while surfaces and self.free_bytes > budget:
+                self.free_bytes -= surface_bytes(surfaces.pop(0))
+
+            if not surfaces:
+                del self.free[key]
+
+class SurfaceAllocator:
+    def __init__(self, pool):
+        self.pool = pool
+
+        self.live = {}
+        self.live_bytes = 0
+
+    def owns(self, surface):
+        return id(surface) in self.live
+
+    def new(self, size, flags=0):
+        surface = self.pool.acquire(size, flags)
+        surface.fill((0, 0, 0, 0))
+
+        self.live[id(surface)] = surface
+        self.live_bytes += surface_bytes(surface)
+
+        return surface
+
+    def copy(self, surface):
+        copy = self.pool.acquire(surface.get_size(), surface.get_flags())
+
+        # with blending and the colorkey off the blit is a straight pixel copy, as Surface.copy() would make
+        alpha, colorkey = surface.get_alpha(), surface.get_colorkey()
+        surface.set_alpha(None)
+        surface.set_colorkey(None)
+
+        copy.blit(surface, (0, 0))
+
+        for target in (surface, copy):
+            target.set_alpha(alpha)
+            target.set_colorkey(colorkey)
+
+        self.live[id(copy)] = copy
+        self.live_bytes += surface_bytes(copy)
+
+        return copy
+
+    def release(self, surface):
+        if self.live.pop(id(surface), None) is None:
+            return
+
+        self.live_bytes -= surface_bytes(surface)
+        self.pool.release(surface)
+
+    def release_all(self):
+        for surface in self.live.values():
+            self.pool.release(surface)
+
+        self.live.clear()
+        self.live_bytes = 0
+
+pool = SurfacePool()
@@ -0,0 +1,145 @@
+import pygame
+
+from abc import ABC, abstractmethod
+
+import fonts
+
+class Widget(ABC):
+    def __init__(self, pos=(0, 0), anchor='topleft'):
+        self.pos = pos
+        self.anchor = anchor
+
+        self.surface = None
+        self.rendered_key = None
+
+    @abstractmethod
+    def key(self):
+        ...
+
+    @abstractmethod
+    def render(self):
+        ...
+
+    def get_surface(self):
+        key = self.key()
+
+        if self.surface is None or key != self.rendered_key:
+            self.surface = self.render()
+            self.rendered_key = key
+
+        return self.surface
+
+    @property
+    def rect(self):
+        return self.get_surface().get_rect(**{self.anchor: self.pos})
+
+    def draw(self, target):
+        return target.blit(self.get_surface(), self.rect)
+
+class Label(Widget):
+    def __init__(self, font, text, color, pos=(0, 0), anchor='topleft'):
+        super().__init__(pos, anchor)
+        self.font = font
+        self.text = text
+        self.color = color
+
+    def key(self):
+        return self.font, self.text, tuple(self.color)
+
+    def render(self):
+        return fonts.render_text(self.font, self.text, self.color)
+
+class Button(Widget):
+    def __init__(self, rect, font, text, color, fill, border_width=7, radius=20):
+        rect = pygame.Rect(rect)
+
+        super().__init__(rect.topleft)
+        self.size = rect.size
+        self.font = font
+        self.text = text
+        self.color = color
+        self.fill = fill
+        self.border_width = border_width
+        self.radius = radius
+
+    @property
+    def rect(self):
+        return pygame.Rect(self.pos, self.size)
+
+    def key(self):
+        return self.size, self.font, self.text, tuple(self.color), tuple(self.fill), self.border_width, self.radius
+
+    def render(self):
+        surface = pygame.Surface(self.size, pygame.SRCALPHA)
+        rect = surface.get_rect()
+
+        pygame.draw.rect(surface, self.fill, rect, 0, self.radius)
+        pygame.draw.rect(surface, self.color, rect, self.border_width, self.radius)
+
+        text = fonts.render_text(self.font, self.text, self.color)
+        surface.blit(text, (rect.centerx - text.get_width() // 2, rect.centery - text.get_height() // 2))
+
+        return surface
+
+    def collidepoint(self, point):
+        return self.rect.collidepoint(point)
+
+class KeyHint(Widget):
+    def __init__(self, text, key, font, key_font, color=(255, 255, 255), key_fill=(128, 128, 128, 128), padding=6):
+        super().__init__()
+        self.text = text
+        self.key_word = key
+        self.font = font
+        self.key_font = key_font
+        self.color = color
+        self.key_fill = key_fill
+        self.padding = padding
+
+    def key(self):
+        return self.text, self.key_word, self.font, self.key_font, tuple(self.color), tuple(self.key_fill), self.padding
+
+    def render(self):
+        padding = self.padding
+
+        before, _, after = self.text.partition(self.key_word)
+
+        before_surf = fonts.render_text(self.font, before, self.color)
+        key_surf = fonts.render_text(self.key_font, self.key_word, self.color)
+        after_surf = fonts.render_text(self.font, after, self.color)
+
+        key_bg_rect = pygame.Rect(0, 0, key_surf.get_width() + padding * 2, key_surf.get_height() + padding * 2)
+
+        surface = pygame.Surface((before_surf.get_width() + key_bg_rect.width + after_surf.get_width(),
+                                  key_bg_rect.height + padding * 2), pygame.SRCALPHA)
+
+        surface.blit(before_surf, (0, padding))
+        offset_x = before_surf.get_width()
+
+        key_bg_rect.topleft = (offset_x, 0)
+        pygame.draw.rect(surface, self.key_fill, key_bg_rect, 0, 20)
+        surface.blit(key_surf, (offset_x + padding, padding))
+        offset_x += key_bg_rect.width
+
+        surface.blit(after_surf, (offset_x, padding))
+
+        return surface
+
+class Panel(Widget):
+    # draws its children into a surface the owner allocated, e.g. from BaseApp.surfaces
+    def __init__(self, surface, children, fill=None, pos=(0, 0)):
+        super().__init__(pos)
+        self.target = surface
+        self.children = children
+        self.fill = fill
+
+    def key(self):
+        return (self.fill, *((child.key(), child.pos) for child in self.children))
+
+    def render(self):
+        if self.fill is not None:
+            self.target.fill(self.fill)
+
+        for child in self.children:
+            child.draw(self.target)
+
+        return self.target